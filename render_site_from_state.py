@@ -12,18 +12,18 @@ from signal_atlas.constants import DEFAULT_URL_SCHEMA, THEME_MAGAZINE_V2
 from signal_atlas.publish import StaticSitePublisher
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Re-render Signal Atlas site from pipeline state")
     parser.add_argument("--state-file", default="state/pipeline_state.json")
     parser.add_argument("--site-dir", default="site")
     parser.add_argument("--site-url", default=None)
     parser.add_argument("--url-schema", choices=["v1", "v2"], default=DEFAULT_URL_SCHEMA)
     parser.add_argument("--theme-variant", default=THEME_MAGAZINE_V2)
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     root = Path(__file__).resolve().parent
     state_path = root / args.state_file
     site_dir = root / args.site_dir
@@ -125,3 +125,5 @@ DEPLOY_FAILURE_DISABLE_COUNT = 3
 
 MAX_PUBLISHED_HISTORY = 500
 MAX_DAILY_HISTORY = 120
+# Consecutive out-of-window rows after which the reverse metrics scan gives up.
+METRICS_WINDOW_STALE_RUN = 64
@@ -30,9 +30,8 @@ class TopicCandidate:
     source_meta: list[SourceMeta] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        data["source_meta"] = [meta.to_dict() for meta in self.source_meta]
-        return data
+        # asdict() already recurses into nested SourceMeta entries.
+        return asdict(self)
 
 
 @dataclass
@@ -51,12 +50,11 @@ class ApprovedTopic:
     source_meta: list[SourceMeta] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        data["source_meta"] = [meta.to_dict() for meta in self.source_meta]
-        return data
+        # asdict() already recurses into nested SourceMeta entries.
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class PublishedBrief:
     slug: str
     vertical: str
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
@@ -16,7 +17,6 @@ from .constants import (
     DEPLOY_FAILURE_DISABLE_COUNT,
     LEGACY_CATEGORY_MAP,
     POLICY_DISABLE_RATE,
-    STORY_PATH_PATTERN_V2,
     THEME_MAGAZINE_V2,
 )
 from .content import build_generated_brief
@@ -30,6 +30,15 @@ from .utils import ensure_dir, isoformat, write_json
 BUDGET_ALERT_RATIO = 0.85
 PREMIUM_EST_KRW = 220.0
 BALANCED_EST_KRW = 120.0
+GENERATION_MAX_WORKERS = 4
+
+_ALL_CATEGORIES_SET = frozenset(ALL_CATEGORIES)
+_ALL_VERTICALS_SET = frozenset(ALL_VERTICALS)
+
+
+def _story_path(category: str, slug: str) -> str:
+    """Same shape as STORY_PATH_PATTERN_V2, without str.format per row."""
+    return f"/stories/{category}/{slug}.html"
 
 
 class Pipeline:
@@ -114,27 +123,19 @@ class Pipeline:
                 max_count=quotas[one_vertical],
             )
 
-            generated = []
+            generated_pairs = self._generate_briefs(
+                approved,
+                budget=budget,
+                requested_engine=generation_engine_requested,
+                requested_quality=quality_tier_requested,
+                gemini_model=gemini_model,
+            )
+            generated = [brief for brief, _ in generated_pairs]
             vertical_generation_counts: dict[str, int] = defaultdict(int)
-            for topic in approved:
-                effective_engine, effective_quality = self._choose_generation_mode(
-                    requested_engine=generation_engine_requested,
-                    requested_quality=quality_tier_requested,
-                    budget=budget,
-                )
-
-                brief = build_generated_brief(
-                    topic,
-                    generation_engine=effective_engine,
-                    quality_tier=effective_quality,
-                    gemini_model=gemini_model,
-                )
-                generated.append(brief)
-
+            for brief, effective_engine in generated_pairs:
                 engine_used = str(brief.payload.get("generation_engine") or effective_engine)
                 generation_counts[engine_used] += 1
                 vertical_generation_counts[engine_used] += 1
-                self._apply_generation_cost_to_budget(budget, brief.payload)
 
             all_generated.extend(generated)
 
@@ -168,7 +169,7 @@ class Pipeline:
 
         run_artifacts = self._write_artifacts(all_generated, now=now, mode=mode)
 
-        publish_counts = defaultdict(int)
+        publish_counts: Counter[str] = Counter()
         published_rows: list[dict] = []
 
         deploy_attempts = 0
@@ -208,8 +209,7 @@ class Pipeline:
                 trim_published_history(state)
 
         elif mode == "dry-run":
-            for vertical_name, count in self._count_generated_by_vertical(all_generated).items():
-                publish_counts[vertical_name] += count
+            publish_counts.update(brief.topic.vertical for brief in all_generated)
 
         # Policy safety auto-disable.
         for vertical_name, stats in per_vertical.items():
@@ -430,6 +430,77 @@ class Pipeline:
         budget["last_quality_tier"] = quality
         return "gemini", quality
 
+    def _estimate_generation_cost(self, engine: str, quality: str) -> float:
+        if engine != "gemini":
+            return 0.0
+        return PREMIUM_EST_KRW if quality == "premium" else BALANCED_EST_KRW
+
+    def _budget_is_tight(self, budget: dict, reserved_krw: float) -> bool:
+        """True when concurrent generations could push spend past the alert ratio or the limit."""
+        spent = float(budget.get("spent_krw") or 0.0) + reserved_krw
+        limit_krw = max(1.0, float(budget.get("limit_krw") or 1.0))
+        return spent >= limit_krw * BUDGET_ALERT_RATIO or limit_krw - spent < PREMIUM_EST_KRW * GENERATION_MAX_WORKERS
+
+    def _generate_briefs(
+        self,
+        topics: list,
+        *,
+        budget: dict,
+        requested_engine: str,
+        requested_quality: str,
+        gemini_model: str,
+    ) -> list[tuple]:
+        """Generate briefs concurrently; returns (brief, planned engine) pairs in topic order.
+
+        Budget decisions stay sequential. Each running generation reserves its estimate until it
+        completes, when the actual cost replaces it. Near the limit, running generations are
+        drained before every decision, so generation falls back to the serial, actual-spend path.
+        """
+        if not topics:
+            return []
+        results: list = [None] * len(topics)
+        pending: dict[Future, tuple[int, str, float]] = {}
+        reserved_krw = 0.0
+
+        def _settle(done) -> None:
+            nonlocal reserved_krw
+            for future in done:
+                index, engine, estimate = pending.pop(future)
+                reserved_krw -= estimate
+                brief = future.result()
+                self._apply_generation_cost_to_budget(budget, brief.payload)
+                results[index] = (brief, engine)
+
+        with ThreadPoolExecutor(max_workers=min(GENERATION_MAX_WORKERS, len(topics))) as pool:
+            for index, topic in enumerate(topics):
+                if len(pending) >= GENERATION_MAX_WORKERS:
+                    _settle(wait(pending, return_when=FIRST_COMPLETED).done)
+                if pending and requested_engine != "template" and self._budget_is_tight(budget, reserved_krw):
+                    _settle(wait(pending).done)
+
+                spent = budget["spent_krw"]
+                budget["spent_krw"] = spent + reserved_krw
+                try:
+                    engine, quality = self._choose_generation_mode(
+                        requested_engine=requested_engine,
+                        requested_quality=requested_quality,
+                        budget=budget,
+                    )
+                finally:
+                    budget["spent_krw"] = spent
+                estimate = self._estimate_generation_cost(engine, quality)
+                future = pool.submit(
+                    build_generated_brief,
+                    topic,
+                    generation_engine=engine,
+                    quality_tier=quality,
+                    gemini_model=gemini_model,
+                )
+                pending[future] = (index, engine, estimate)
+                reserved_krw += estimate
+            _settle(wait(pending).done)
+        return results
+
     def _apply_generation_cost_to_budget(self, budget: dict, payload: dict) -> None:
         engine = str(payload.get("generation_engine") or "")
         if not engine.startswith("gemini"):
@@ -450,6 +521,9 @@ class Pipeline:
         for row in rows:
             if not isinstance(row, dict):
                 continue
+            if self._is_migrated_row(row):
+                migrated.append({**row, "legacy_paths": list(row["legacy_paths"])})
+                continue
 
             obj = dict(row)
             vertical = str(obj.get("vertical") or "")
@@ -467,7 +541,7 @@ class Pipeline:
                 obj["vertical"] = vertical
 
             category = LEGACY_CATEGORY_MAP.get(category, category)
-            if not category or category not in set(ALL_CATEGORIES):
+            if not category or category not in _ALL_CATEGORIES_SET:
                 category = DEFAULT_CATEGORY
             obj["category"] = category
             obj.pop("subcategory", None)
@@ -478,16 +552,16 @@ class Pipeline:
                 parts = path.strip("/").split("/")
                 if len(parts) >= 3 and parts[0] == "stories":
                     normalized = LEGACY_CATEGORY_MAP.get(parts[1], parts[1])
-                    obj["category"] = normalized if normalized in set(ALL_CATEGORIES) else category
+                    obj["category"] = normalized if normalized in _ALL_CATEGORIES_SET else category
                     obj["path"] = f"/stories/{obj['category']}/{parts[-1]}"
                 elif len(parts) >= 3 and parts[0] == "category":
                     normalized = LEGACY_CATEGORY_MAP.get(parts[1], parts[1])
-                    obj["category"] = normalized if normalized in set(ALL_CATEGORIES) else category
+                    obj["category"] = normalized if normalized in _ALL_CATEGORIES_SET else category
                     old_path = f"/category/{obj['category']}/{parts[-1]}"
                     obj["path"] = f"/stories/{obj['category']}/{parts[-1]}"
                 elif len(parts) >= 3 and parts[0] in ALL_VERTICALS:
                     normalized = LEGACY_CATEGORY_MAP.get(parts[1], parts[1])
-                    obj["category"] = normalized if normalized in set(ALL_CATEGORIES) else category
+                    obj["category"] = normalized if normalized in _ALL_CATEGORIES_SET else category
                     old_path = f"/{parts[0]}/{parts[1]}/{parts[-1]}"
                     obj["path"] = f"/stories/{obj['category']}/{parts[-1]}"
                 elif len(parts) == 2 and parts[0] in ALL_VERTICALS:
@@ -496,11 +570,11 @@ class Pipeline:
                 else:
                     slug = str(obj.get("slug") or "").strip()
                     if slug:
-                        obj["path"] = STORY_PATH_PATTERN_V2.format(category=category, slug=slug)
+                        obj["path"] = _story_path(category, slug)
             else:
                 slug = str(obj.get("slug") or "").strip()
                 if slug:
-                    obj["path"] = STORY_PATH_PATTERN_V2.format(category=category, slug=slug)
+                    obj["path"] = _story_path(category, slug)
 
             if path and path != obj.get("path"):
                 old_path = path
@@ -513,3 +587,21 @@ class Pipeline:
             migrated.append(obj)
 
         state["published"] = migrated
+
+    def _is_migrated_row(self, row: dict) -> bool:
+        """True when migration would leave the row unchanged."""
+        category = row.get("category")
+        vertical = row.get("vertical")
+        # Non-string values (e.g. lists from hand-edited state) are unhashable; the slow path coerces them.
+        if not isinstance(category, str) or not isinstance(vertical, str):
+            return False
+        if category not in _ALL_CATEGORIES_SET or vertical not in _ALL_VERTICALS_SET:
+            return False
+        if "subcategory" in row or not isinstance(row.get("legacy_paths"), list):
+            return False
+        if not isinstance(row.get("url_schema"), str) or not row["url_schema"]:
+            return False
+        if not isinstance(row.get("template_version"), str) or not row["template_version"]:
+            return False
+        parts = str(row.get("path") or "").split("/")
+        return len(parts) == 4 and parts[0] == "" and parts[1] == "stories" and parts[2] == category and bool(parts[3])
@@ -26,11 +26,18 @@ _FINANCE_ADVICE_PATTERNS = (
 )
 
 
+def _hits(patterns: tuple[str, ...], title: str, snippet: str) -> bool:
+    for pattern in patterns:
+        if pattern in title or pattern in snippet:
+            return True
+    return False
+
+
 def evaluate_policy(topic: TopicCandidate) -> PolicyResult:
     """Evaluate a topic against simple but strict safety rules."""
-    norm_title = normalize_text(topic.title)
+    stripped_title = topic.title.strip()
+    norm_title = normalize_text(stripped_title)
     norm_snippet = normalize_text(topic.snippet)
-    merged = f"{norm_title} {norm_snippet}".strip()
 
     flags: list[str] = []
 
@@ -40,13 +47,13 @@ def evaluate_policy(topic: TopicCandidate) -> PolicyResult:
     if len(norm_title.split()) < 4:
         flags.append("low_substance_title")
 
-    if topic.title.strip().isupper() and len(topic.title.strip()) > 15:
+    if len(stripped_title) > 15 and stripped_title.isupper():
         flags.append("shouting_title")
 
-    if any(p in merged for p in _EXAGGERATION_PATTERNS):
+    if _hits(_EXAGGERATION_PATTERNS, norm_title, norm_snippet):
         flags.append("exaggerated_claim")
 
-    if topic.vertical == VERTICAL_FINANCE and any(p in merged for p in _FINANCE_ADVICE_PATTERNS):
+    if topic.vertical == VERTICAL_FINANCE and _hits(_FINANCE_ADVICE_PATTERNS, norm_title, norm_snippet):
         flags.append("finance_investment_advice")
 
     blocked = any(flag in {"missing_source", "finance_investment_advice"} for flag in flags)
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import html
 import json
 import os
 import re
 import shutil
+import threading
 import urllib.parse
 import urllib.request
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
 from typing import Iterable
 
@@ -27,7 +31,10 @@ from .constants import (
     URL_SCHEMA_V2,
 )
 from .models import ApprovedTopic, GeneratedBrief, PublishedBrief
-from .utils import ensure_dir
+from .utils import dumps_json_compact, ensure_dir
+
+_PARALLEL_WRITE_MIN_FILES = 64
+_WRITE_MAX_WORKERS = 8
 
 _COVER_COLORS = {
     "ai": ("#0ea5e9", "#0369a1"),
@@ -39,570 +46,8 @@ _COVER_COLORS = {
     "general": ("#64748b", "#334155"),
 }
 
-
-def build_story_path(category: str, slug: str, schema: str = DEFAULT_URL_SCHEMA) -> str:
-    if schema == URL_SCHEMA_V2:
-        return STORY_PATH_PATTERN_V2.format(category=category, slug=slug)
-    return f"/category/{category}/{slug}.html"
-
-
-def build_category_path(category: str, schema: str = DEFAULT_URL_SCHEMA) -> str:
-    if schema == URL_SCHEMA_V2:
-        return TOPIC_PATH_PATTERN_V2.format(category=category)
-    return f"/category/{category}/index.html"
-
-
-class StaticSitePublisher:
-    def __init__(
-        self,
-        site_dir: str,
-        site_url: str | None = None,
-        adsense_client: str | None = None,
-        url_schema: str | None = None,
-        theme_variant: str | None = None,
-    ):
-        self.site_dir = Path(site_dir)
-        self.site_url = (
-            site_url
-            or os.getenv("SIGNAL_ATLAS_SITE_URL")
-            or os.getenv("AUTOTREND_SITE_URL")
-            or "https://signal-atlas.example.com"
-        ).rstrip("/")
-        self.adsense_client = adsense_client or os.getenv("ADSENSE_CLIENT_ID") or "ca-pub-REPLACE_ME"
-        self.url_schema = str(url_schema or os.getenv("URL_SCHEMA") or DEFAULT_URL_SCHEMA).strip().lower() or DEFAULT_URL_SCHEMA
-        self.theme_variant = str(theme_variant or os.getenv("THEME_VARIANT") or THEME_MAGAZINE_V2).strip() or THEME_MAGAZINE_V2
-        parsed = urllib.parse.urlparse(self.site_url)
-        path = (parsed.path or "").rstrip("/")
-        self.base_path = "" if path in {"", "/"} else path
-
-    def publish(
-        self,
-        generated_briefs: list[GeneratedBrief],
-        existing_rows: Iterable[dict],
-        now_iso: str,
-    ) -> list[PublishedBrief]:
-        existing_posts = self._load_existing_rows(existing_rows)
-        existing_by_slug = {post.slug: post for post in existing_posts}
-        new_posts: list[PublishedBrief] = []
-
-        staging = self.site_dir.parent / f"{self.site_dir.name}.staging"
-        backup = self.site_dir.parent / f"{self.site_dir.name}.backup"
-
-        if staging.exists():
-            shutil.rmtree(staging)
-        ensure_dir(staging)
-        self._cleanup_legacy_pages(staging)
-        self._write_shared_assets(staging)
-
-        generated_by_slug: dict[str, GeneratedBrief] = {}
-        used_paths = {post.path for post in existing_posts}
-        for brief in generated_briefs:
-            slug = brief.slug
-            old = existing_by_slug.get(brief.slug)
-            path = build_story_path(brief.topic.category, slug, self.url_schema)
-            if old and old.category == brief.topic.category:
-                path = old.path
-                used_paths.discard(path)
-            else:
-                suffix = 2
-                while path in used_paths:
-                    slug = f"{brief.slug}-{suffix}"
-                    path = build_story_path(brief.topic.category, slug, self.url_schema)
-                    suffix += 1
-            used_paths.add(path)
-            brief.slug = slug
-            brief.payload["slug"] = slug
-            primary_image = str(brief.payload.get("hero_image_url") or f"/assets/covers/{brief.topic.category}.svg")
-            legacy_paths: list[str] = []
-            if old:
-                for legacy in [old.path, *old.legacy_paths]:
-                    one = str(legacy or "").strip()
-                    if one and one != path and one not in legacy_paths:
-                        legacy_paths.append(one)
-            default_legacy = f"/category/{brief.topic.category}/{slug}.html"
-            if self.url_schema == URL_SCHEMA_V2 and default_legacy != path and default_legacy not in legacy_paths:
-                legacy_paths.append(default_legacy)
-            published = PublishedBrief(
-                slug=slug,
-                vertical=brief.topic.vertical,
-                title=brief.topic.title,
-                published_at=now_iso,
-                word_count=brief.word_count,
-                source_urls=list(brief.payload.get("source_urls") or brief.topic.source_urls),
-                ad_slots=list(ADSENSE_SLOTS),
-                dedupe_hash=brief.topic.dedupe_hash,
-                path=path,
-                category=brief.topic.category,
-                primary_image=primary_image,
-                seo_title=str(brief.payload.get("seo_title") or brief.topic.title),
-                meta_description=str(brief.payload.get("meta_description") or PROJECT_TAGLINE),
-                legacy_paths=legacy_paths,
-                url_schema=self.url_schema,
-                template_version=self.theme_variant,
-            )
-            published.primary_image = self._localize_primary_image(published, staging)
-            brief.payload["hero_image_url"] = published.primary_image
-            new_posts.append(published)
-            generated_by_slug[published.slug] = brief
-
-        all_posts = self._merge_posts(existing_posts, new_posts)
-        for post in all_posts:
-            post.primary_image = self._localize_primary_image(post, staging)
-            self._ensure_post_thumbnail(post, staging)
-        all_posts.sort(key=lambda p: str(p.published_at), reverse=True)
-
-        # Render every post page from state + generated payload (no legacy file mutation flow).
-        for post in all_posts:
-            brief = generated_by_slug.get(post.slug) or self._fallback_generated_brief(post, now_iso=now_iso)
-            internal_links = [p for p in all_posts if p.category == post.category and p.path != post.path][:6]
-            html_body = self._render_post_html(brief, post, internal_links)
-            out_path = staging / post.path.lstrip("/")
-            ensure_dir(out_path.parent)
-            out_path.write_text(html_body, encoding="utf-8")
-            for legacy_path in post.legacy_paths:
-                self.write_redirect_page(staging, legacy_path, post.path)
-
-        # Render aggregate pages.
-        (staging / "index.html").write_text(self._render_home_html(all_posts), encoding="utf-8")
-        for category in ALL_CATEGORIES:
-            category_posts = [p for p in all_posts if p.category == category]
-            category_path = build_category_path(category, self.url_schema)
-            out_path = staging / category_path.lstrip("/")
-            ensure_dir(out_path.parent)
-            out_path.write_text(self._render_category_html(category, category_posts), encoding="utf-8")
-            if self.url_schema == URL_SCHEMA_V2:
-                self.write_redirect_page(staging, f"/category/{category}/index.html", category_path)
-
-        (staging / "robots.txt").write_text(self._render_robots(), encoding="utf-8")
-        (staging / "sitemap.xml").write_text(self._render_sitemap(all_posts), encoding="utf-8")
-        (staging / "rss.xml").write_text(self._render_rss(all_posts), encoding="utf-8")
-
-        if backup.exists():
-            shutil.rmtree(backup)
-
-        try:
-            if self.site_dir.exists():
-                self.site_dir.replace(backup)
-            staging.replace(self.site_dir)
-            if backup.exists():
-                shutil.rmtree(backup)
-        except Exception:
-            if self.site_dir.exists() and self.site_dir != staging:
-                shutil.rmtree(self.site_dir, ignore_errors=True)
-            if backup.exists():
-                backup.replace(self.site_dir)
-            raise
-
-        return new_posts
-
-    def _load_existing_rows(self, rows: Iterable[dict]) -> list[PublishedBrief]:
-        out: list[PublishedBrief] = []
-        for row in rows:
-            try:
-                out.append(
-                    PublishedBrief(
-                        slug=str(row["slug"]),
-                        vertical=str(row.get("vertical") or ""),
-                        title=str(row["title"]),
-                        published_at=str(row["published_at"]),
-                        word_count=int(row.get("word_count") or 0),
-                        source_urls=list(row.get("source_urls") or []),
-                        ad_slots=list(row.get("ad_slots") or []),
-                        dedupe_hash=str(row.get("dedupe_hash") or ""),
-                        path=build_story_path(
-                            str(row.get("category") or row.get("subcategory") or "general"),
-                            str(row["slug"]),
-                            self.url_schema,
-                        ),
-                        category=str(row.get("category") or row.get("subcategory") or "general"),
-                        primary_image=str(row.get("primary_image") or ""),
-                        seo_title=str(row.get("seo_title") or row.get("title") or ""),
-                        meta_description=str(row.get("meta_description") or PROJECT_TAGLINE),
-                        legacy_paths=[
-                            one
-                            for one in [str(row.get("path") or "")] + [str(item) for item in list(row.get("legacy_paths") or [])]
-                            if one and one != build_story_path(
-                                str(row.get("category") or row.get("subcategory") or "general"),
-                                str(row["slug"]),
-                                self.url_schema,
-                            )
-                        ],
-                        url_schema=str(row.get("url_schema") or self.url_schema),
-                        template_version=str(row.get("template_version") or self.theme_variant),
-                    )
-                )
-            except (KeyError, TypeError, ValueError):
-                continue
-        return out
-
-    def _merge_posts(self, existing: list[PublishedBrief], new: list[PublishedBrief]) -> list[PublishedBrief]:
-        merged: dict[str, PublishedBrief] = {row.path: row for row in existing}
-        for row in new:
-            prior = merged.get(row.path)
-            if prior:
-                merged_legacy: list[str] = []
-                for one in [*prior.legacy_paths, *row.legacy_paths]:
-                    if one and one not in merged_legacy and one != row.path:
-                        merged_legacy.append(one)
-                row.legacy_paths = merged_legacy
-            merged[row.path] = row
-        return list(merged.values())
-
-    def _cleanup_legacy_pages(self, root: Path) -> None:
-        for vertical in ALL_VERTICALS:
-            old_dir = root / vertical
-            if old_dir.exists():
-                shutil.rmtree(old_dir, ignore_errors=True)
-        legacy_category_root = root / "category"
-        if legacy_category_root.exists():
-            shutil.rmtree(legacy_category_root, ignore_errors=True)
-
-    def write_redirect_page(self, root: Path, from_path: str, to_path: str) -> None:
-        src = str(from_path or "").strip()
-        dst = str(to_path or "").strip()
-        if not src or not dst or src == dst:
-            return
-        if not src.startswith("/"):
-            src = f"/{src}"
-        if not dst.startswith("/"):
-            dst = f"/{dst}"
-        out_path = root / src.lstrip("/")
-        ensure_dir(out_path.parent)
-        target = self._href(dst)
-        canonical = self._public_url(dst)
-        out_path.write_text(
-            (
-                "<!doctype html>\n"
-                "<html lang=\"en\"><head>"
-                "<meta charset=\"utf-8\" />"
-                "<meta http-equiv=\"refresh\" content=\"0;url={target}\" />"
-                "<link rel=\"canonical\" href=\"{canonical}\" />"
-                "<meta name=\"robots\" content=\"noindex, follow\" />"
-                "<title>Redirecting...</title>"
-                "</head><body>"
-                "<p>Redirecting to <a href=\"{target}\">{target}</a></p>"
-                "<script>location.replace({target_json});</script>"
-                "</body></html>\n"
-            ).format(
-                target=html.escape(target),
-                canonical=html.escape(canonical),
-                target_json=json.dumps(target),
-            ),
-            encoding="utf-8",
-        )
-
-    def _fallback_generated_brief(self, post: PublishedBrief, *, now_iso: str) -> GeneratedBrief:
-        source_urls = list(post.source_urls or [])
-        if len(source_urls) < 3:
-            source_urls.extend(
-                [
-                    f"https://news.google.com/rss/search?q={urllib.parse.quote_plus(post.title)}",
-                    f"https://www.bing.com/news/search?q={urllib.parse.quote_plus(post.title)}",
-                    f"https://duckduckgo.com/?q={urllib.parse.quote_plus(post.title)}&ia=news",
-                ][: 3 - len(source_urls)]
-            )
-
-        topic = ApprovedTopic(
-            id=f"fallback-{post.slug}",
-            vertical=post.vertical,
-            title=post.title,
-            source_urls=source_urls,
-            discovered_at=post.published_at or now_iso,
-            confidence_score=0.8,
-            policy_score=0.95,
-            dedupe_hash=post.dedupe_hash or f"fallback-{post.slug}",
-            category=post.category,
-            snippet=post.meta_description or PROJECT_TAGLINE,
-        )
-        summary = post.meta_description or f"{post.title} is a trend signal in {CATEGORY_LABELS.get(post.category, post.category)}."
-        payload = {
-            "slug": post.slug,
-            "title": post.title,
-            "vertical": post.vertical,
-            "category": post.category,
-            "category_label": CATEGORY_LABELS.get(post.category, post.category),
-            "seo_title": post.seo_title or f"{post.title} | {PROJECT_TITLE}",
-            "meta_description": post.meta_description or PROJECT_TAGLINE,
-            "summary": summary,
-            "key_points": [
-                "Market attention around this topic has increased across multiple outlets.",
-                "Operators should track follow-up releases and execution evidence.",
-                "The directional signal is useful only when validated with source continuity.",
-                "Short-term hype should be separated from durable demand indicators.",
-            ],
-            "deep_dive": [
-                f"{summary} The operational takeaway is to monitor whether the trend sustains across two or more cycles.",
-                "Teams should validate signal strength through repeated source confirmations and measurable outcomes.",
-            ],
-            "implications": [
-                "Commercially, this can influence roadmap sequencing and go-to-market timing.",
-                "Operationally, this highlights the need for disciplined tracking and evidence-based decisions.",
-            ],
-            "contrarian_view": "A contrarian read is that short-lived momentum can revert quickly without durable adoption.",
-            "faq": [
-                {
-                    "q": "Why does this matter now?",
-                    "a": "The topic appears repeatedly across sources, suggesting actionable timing signals.",
-                },
-                {
-                    "q": "What should teams monitor next?",
-                    "a": "Track follow-up releases, implementation evidence, and consistency in source coverage.",
-                },
-                {
-                    "q": "What is the main risk?",
-                    "a": "The main risk is overreacting to temporary attention spikes.",
-                },
-            ],
-            "source_urls": source_urls,
-            "hero_image_url": post.primary_image or f"/assets/covers/{post.category}.svg",
-            "hero_image_alt": f"{post.title} trend coverage",
-            "disclaimer": "",
-            "ad_slots": list(ADSENSE_SLOTS),
-            "reading_time": max(1, round(max(1, post.word_count) / 220)),
-            "json_ld": {},
-            "generation_engine": "template",
-            "quality_tier": "balanced",
-        }
-        return GeneratedBrief(
-            topic=topic,
-            slug=post.slug,
-            markdown=f"# {post.title}\n\n{summary}\n",
-            payload=payload,
-            word_count=max(900, int(post.word_count or 0)),
-        )
-
-    def _guess_image_ext(self, url: str, content_type: str = "") -> str:
-        mime_map = {
-            "image/jpeg": ".jpg",
-            "image/jpg": ".jpg",
-            "image/png": ".png",
-            "image/webp": ".webp",
-            "image/gif": ".gif",
-            "image/avif": ".avif",
-        }
-        if content_type in mime_map:
-            return mime_map[content_type]
-        path = urllib.parse.urlparse(url).path.lower()
-        for ext in (".jpg", ".jpeg", ".png", ".webp", ".gif", ".avif"):
-            if path.endswith(ext):
-                return ".jpg" if ext == ".jpeg" else ext
-        return ".jpg"
-
-    def _localize_primary_image(self, post: PublishedBrief, root: Path) -> str:
-        fallback = f"/assets/covers/{post.category}.svg"
-        current = str(post.primary_image or "").strip()
-        if not current:
-            return fallback
-        if current.startswith("/"):
-            return current
-        if not (current.startswith("http://") or current.startswith("https://")):
-            return fallback
-
-        images_dir = root / "assets" / "images"
-        ensure_dir(images_dir)
-
-        existing_ext = self._guess_image_ext(current)
-        existing_name = f"{post.slug}{existing_ext}"
-        existing_path = images_dir / existing_name
-        if existing_path.exists():
-            return f"/assets/images/{existing_name}"
-
-        try:
-            req = urllib.request.Request(
-                current,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (SignalAtlas/1.0)",
-                    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
-                },
-            )
-            with urllib.request.urlopen(req, timeout=8) as resp:
-                content_type = (resp.headers.get("Content-Type") or "").split(";")[0].strip().lower()
-                if not content_type.startswith("image/"):
-                    return fallback
-                blob = resp.read(2_500_001)
-            if not blob or len(blob) > 2_500_000:
-                return fallback
-            ext = self._guess_image_ext(current, content_type)
-            filename = f"{post.slug}{ext}"
-            out_path = images_dir / filename
-            out_path.write_bytes(blob)
-            return f"/assets/images/{filename}"
-        except Exception:
-            return fallback
-
-    def _thumbnail_relpath(self, post: PublishedBrief) -> str:
-        return f"/assets/thumbs/{post.slug}.svg"
-
-    def _split_lines(self, text: str, *, max_chars: int, max_lines: int) -> list[str]:
-        compact = " ".join(str(text or "").split()).strip()
-        if not compact:
-            return []
-        words = compact.split(" ")
-        lines: list[str] = []
-        current = ""
-        truncated = False
-
-        for word in words:
-            if len(word) > max_chars:
-                if current:
-                    lines.append(current)
-                    current = ""
-                    if len(lines) >= max_lines:
-                        truncated = True
-                        break
-                lines.append(word[: max_chars - 3].rstrip() + "...")
-                if len(lines) >= max_lines:
-                    truncated = True
-                    break
-                continue
-
-            candidate = word if not current else f"{current} {word}"
-            if len(candidate) <= max_chars:
-                current = candidate
-                continue
-
-            lines.append(current)
-            if len(lines) >= max_lines:
-                truncated = True
-                break
-            current = word
-
-        if not truncated and current:
-            if len(lines) < max_lines:
-                lines.append(current)
-            else:
-                truncated = True
-
-        if truncated and lines and not lines[-1].endswith("..."):
-            lines[-1] = lines[-1][: max(1, max_chars - 3)].rstrip() + "..."
-        return lines[:max_lines]
-
-    def _build_post_thumbnail_svg(self, post: PublishedBrief) -> str:
-        c1, c2 = _COVER_COLORS.get(post.category, _COVER_COLORS["general"])
-        category_label = CATEGORY_LABELS.get(post.category, post.category).upper()
-        title_lines = self._split_lines(post.title, max_chars=34, max_lines=3) or ["Signal Atlas Brief"]
-        desc_seed = post.meta_description or PROJECT_TAGLINE
-        desc_lines = self._split_lines(desc_seed, max_chars=46, max_lines=2)
-
-        title_y = 238
-        title_line_height = 68
-        desc_y = title_y + title_line_height * len(title_lines) + 28
-        desc_line_height = 38
-
-        title_tspans = "".join(
-            [
-                f"<tspan x='96' y='{title_y + idx * title_line_height}'>{html.escape(line)}</tspan>"
-                for idx, line in enumerate(title_lines)
-            ]
-        )
-        desc_tspans = "".join(
-            [
-                f"<tspan x='96' y='{desc_y + idx * desc_line_height}'>{html.escape(line)}</tspan>"
-                for idx, line in enumerate(desc_lines)
-            ]
-        )
-        published = html.escape(str(post.published_at)[:10])
-
-        return f"""<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 1200 675' role='img' aria-label='{html.escape(post.title)}'>
-<defs>
-  <linearGradient id='g' x1='0' y1='0' x2='1' y2='1'>
-    <stop offset='0%' stop-color='{c1}'/>
-    <stop offset='100%' stop-color='{c2}'/>
-  </linearGradient>
-  <linearGradient id='mask' x1='0' y1='0' x2='0' y2='1'>
-    <stop offset='0%' stop-color='rgba(15,23,42,.1)'/>
-    <stop offset='100%' stop-color='rgba(15,23,42,.76)'/>
-  </linearGradient>
-</defs>
-<rect width='1200' height='675' fill='url(#g)'/>
-<rect width='1200' height='675' fill='url(#mask)'/>
-<circle cx='1070' cy='110' r='170' fill='rgba(255,255,255,.16)'/>
-<circle cx='105' cy='600' r='210' fill='rgba(255,255,255,.1)'/>
-<rect x='64' y='78' width='800' height='520' rx='28' fill='rgba(2,6,23,.62)' stroke='rgba(255,255,255,.17)' stroke-width='2'/>
-<rect x='96' y='112' width='240' height='44' rx='22' fill='rgba(255,255,255,.94)'/>
-<text x='216' y='141' text-anchor='middle' fill='#0f172a' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='24' font-weight='700' letter-spacing='1'>{html.escape(category_label)}</text>
-<text x='96' y='{title_y}' fill='#f8fafc' font-family='Newsreader,Georgia,serif' font-size='58' font-weight='700' letter-spacing='.2'>
-  {title_tspans}
-</text>
-<text x='96' y='{desc_y}' fill='rgba(241,245,249,.95)' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='30' font-weight='600'>
-  {desc_tspans}
-</text>
-<text x='96' y='560' fill='rgba(226,232,240,.95)' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='24'>Published {published}</text>
-<text x='1112' y='620' text-anchor='end' fill='rgba(241,245,249,.94)' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='26' letter-spacing='2'>SIGNAL ATLAS</text>
-</svg>"""
-
-    def _ensure_post_thumbnail(self, post: PublishedBrief, root: Path) -> None:
-        thumbs_dir = root / "assets" / "thumbs"
-        ensure_dir(thumbs_dir)
-        thumb_path = thumbs_dir / f"{post.slug}.svg"
-        thumb_path.write_text(self._build_post_thumbnail_svg(post), encoding="utf-8")
-
-    def _article_cover_block(self, *, category: str, title: str, description: str) -> str:
-        category_label = CATEGORY_LABELS.get(category, category)
-        safe_title = html.escape(str(title or ""))
-        safe_desc = html.escape(str(description or PROJECT_TAGLINE))
-        safe_category = html.escape(str(category))
-        safe_label = html.escape(str(category_label))
-        return (
-            f'<div class="article-cover featured-media featured-media-text" data-category="{safe_category}">'
-            f'<span class="featured-media-inner">'
-            f'<span class="cover-chip">{safe_label}</span>'
-            f'<strong class="cover-title">{safe_title}</strong>'
-            f'<span class="cover-desc">{safe_desc}</span>'
-            f'</span></div>'
-        )
-
-    def _refresh_existing_post_layouts(self, root: Path, posts: list[PublishedBrief]) -> None:
-        hero_pattern = re.compile(r'<img class="hero-image"[^>]*?>', re.IGNORECASE)
-        topbar_pattern = re.compile(r'<header class="site-topbar">.*?</header>', re.IGNORECASE | re.DOTALL)
-        skip_link_markup = '  <a class="skip-link" href="#main-content">Skip to content</a>'
-        for post in posts:
-            post_file = root / post.path.lstrip("/")
-            if not post_file.exists():
-                continue
-            try:
-                blob = post_file.read_text(encoding="utf-8")
-            except OSError:
-                continue
-            rewritten = blob
-            if 'class="hero-image"' in rewritten:
-                replacement = self._article_cover_block(
-                    category=post.category,
-                    title=post.title,
-                    description=post.meta_description or PROJECT_TAGLINE,
-                )
-                rewritten = hero_pattern.sub(replacement, rewritten, count=1)
-
-            if "<h2>Sources</h2>" in rewritten:
-                rewritten = rewritten.replace("<h2>Sources</h2>\n  <ul>", '<h2>Sources</h2>\n  <ul class="source-list">', 1)
-                rewritten = rewritten.replace("<li><code>", '<li class="source-item"><code>')
-
-            topbar_html = self._render_topbar(canonical_path=post.path).strip()
-            if '<header class="site-topbar">' in rewritten:
-                rewritten = topbar_pattern.sub(topbar_html, rewritten, count=1)
-            elif "<body>" in rewritten:
-                rewritten = rewritten.replace("<body>", f"<body>\n{topbar_html}", 1)
-
-            if 'class="skip-link"' not in rewritten and "<body>" in rewritten:
-                rewritten = rewritten.replace("<body>", f"<body>\n{skip_link_markup}", 1)
-            if '<main id="main-content">' not in rewritten:
-                rewritten = rewritten.replace("<main>", '<main id="main-content">', 1)
-
-            # Normalize legacy absolute URLs and root-relative links for current deployment base path.
-            if "https://signal-atlas.example.com" in rewritten:
-                rewritten = rewritten.replace("https://signal-atlas.example.com", self.site_url)
-            rewritten = self._rewrite_root_relative_links(rewritten)
-
-            if rewritten != blob:
-                post_file.write_text(rewritten, encoding="utf-8")
-
-    def _write_shared_assets(self, root: Path) -> None:
-        css_dir = root / "assets"
-        covers_dir = css_dir / "covers"
-        ensure_dir(covers_dir)
-
-        (css_dir / "site.css").write_text(
-            """
+_SITE_CSS = (
+    """
 :root {
   --bg: #f3f5f9;
   --text: #111827;
@@ -957,26 +402,890 @@ nav.categories a {
     padding-bottom: .08rem;
   }
 }
-            """.strip()
-            + "\n",
-            encoding="utf-8",
+""".strip()
+    + "\n"
+).encode("utf-8")
+
+
+@functools.cache
+def _cover_svg(category: str) -> bytes:
+    c1, c2 = _COVER_COLORS.get(category, _COVER_COLORS["general"])
+    label = html.escape(CATEGORY_LABELS.get(category, category).upper())
+    svg = f"""<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 1200 675' role='img' aria-label='{label}'>
+<defs><linearGradient id='g' x1='0' y1='0' x2='1' y2='1'><stop offset='0%' stop-color='{c1}'/><stop offset='100%' stop-color='{c2}'/></linearGradient></defs>
+<rect width='1200' height='675' fill='url(#g)'/>
+<circle cx='1040' cy='120' r='220' fill='rgba(255,255,255,.15)'/>
+<circle cx='140' cy='560' r='240' fill='rgba(255,255,255,.12)'/>
+<text x='72' y='570' fill='rgba(255,255,255,.95)' font-family='Georgia,serif' font-size='72' letter-spacing='2'>{label}</text>
+</svg>"""
+    return svg.encode("utf-8")
+
+
+def _esc(text: str) -> str:
+    """html.escape with a fast path for the common case of nothing to escape."""
+    if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+        return html.escape(text)
+    return text
+
+
+_ESC_PROJECT_TITLE = html.escape(PROJECT_TITLE)
+_ESC_PROJECT_TAGLINE = html.escape(PROJECT_TAGLINE)
+_ESC_CATEGORY_LABELS = {category: html.escape(label) for category, label in CATEGORY_LABELS.items()}
+
+
+def _esc_category_label(category: str) -> str:
+    label = _ESC_CATEGORY_LABELS.get(category)
+    return label if label is not None else _esc(category)
+
+
+@dataclass(slots=True)
+class _PostView:
+    """Escaped fields of one post, computed once per publish and shared by every listing."""
+
+    post: PublishedBrief
+    esc_title: str
+    esc_href: str
+    esc_url: str
+    esc_meta: str
+    esc_published: str
+    esc_category: str
+    esc_category_label: str
+
+
+_ISO_SECONDS_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}:\d{2}:\d{2})([+-]\d{2}):(\d{2})")
+_RFC822_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_RFC822_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@functools.lru_cache(maxsize=1024)
+def _rfc822_date(value: str) -> str:
+    """Format an ISO timestamp for RSS, slicing the common seconds-precision form directly."""
+    match = _ISO_SECONDS_RE.fullmatch(value)
+    if match:
+        year, month, day, clock, tz_hours, tz_minutes = match.groups()
+        try:
+            weekday = _RFC822_DAYS[date(int(year), int(month), int(day)).weekday()]
+            return f"{weekday}, {day} {_RFC822_MONTHS[int(month) - 1]} {year} {clock} {tz_hours}{tz_minutes}"
+        except (ValueError, IndexError):
+            pass
+    try:
+        return datetime.fromisoformat(value).strftime("%a, %d %b %Y %H:%M:%S %z")
+    except ValueError:
+        return value
+
+
+_PAGE_HEAD_OPEN = (
+    "<!doctype html>\n"
+    "<html lang=\"en\">\n"
+    "<head>\n"
+    "  <meta charset=\"utf-8\" />\n"
+    "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
+    "  <title>"
+)
+_PAGE_CLOSE = (
+    f"\n    <p class=\"footer-note\">{_ESC_PROJECT_TITLE} · {_ESC_PROJECT_TAGLINE}</p>\n"
+    "  </main>\n"
+    "</body>\n"
+    "</html>\n"
+)
+_REDIRECT_HEAD = "<!doctype html>\n<html lang=\"en\"><head><meta charset=\"utf-8\" />"
+_REDIRECT_MIDDLE = "<meta name=\"robots\" content=\"noindex, follow\" /><title>Redirecting...</title></head><body>"
+_AD_SLOT_HTML = {
+    slot: f"<div class=\"ad-slot\" data-slot=\"{html.escape(slot)}\">AdSense Slot: {html.escape(slot)}</div>"
+    for slot in ADSENSE_SLOTS
+}
+
+
+@functools.cache
+def _seo_head_template(og_type: str, has_image: bool) -> str:
+    """Return the static SEO head for one (og_type, has_image) pair as a format template."""
+    esc_og_type = html.escape(og_type).replace("{", "{{").replace("}", "}}")
+    og_image_tag = '<meta property="og:image" content="{image_url}" />' if has_image else ""
+    tw_image_tag = '<meta name="twitter:image" content="{image_url}" />' if has_image else ""
+    return f"""
+  <meta name=\"description\" content=\"{{description}}\" />
+  <meta name=\"robots\" content=\"index, follow, max-image-preview:large\" />
+  <meta name=\"theme-color\" content=\"#0f172a\" />
+  <link rel=\"canonical\" href=\"{{canonical_url}}\" />
+  <link rel=\"alternate\" hreflang=\"en\" href=\"{{canonical_url}}\" />
+  <link rel=\"alternate\" type=\"application/rss+xml\" title=\"{_ESC_PROJECT_TITLE} RSS\" href=\"{{rss_href}}\" />
+  <meta property=\"og:type\" content=\"{esc_og_type}\" />
+  <meta property=\"og:site_name\" content=\"{_ESC_PROJECT_TITLE}\" />
+  <meta property=\"og:title\" content=\"{{title}}\" />
+  <meta property=\"og:description\" content=\"{{description}}\" />
+  <meta property=\"og:url\" content=\"{{canonical_url}}\" />
+  {og_image_tag}
+  <meta name=\"twitter:card\" content=\"summary_large_image\" />
+  <meta name=\"twitter:title\" content=\"{{title}}\" />
+  <meta name=\"twitter:description\" content=\"{{description}}\" />
+  {tw_image_tag}
+  <link rel=\"preconnect\" href=\"https://fonts.googleapis.com\" />
+  <link rel=\"preconnect\" href=\"https://fonts.gstatic.com\" crossorigin />
+  <link href=\"https://fonts.googleapis.com/css2?family=Newsreader:wght@500;700&family=Source+Sans+3:wght@400;600;700&display=swap\" rel=\"stylesheet\" />
+  {{json_ld}}
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def _topbar_html(base_path: str, url_schema: str, active: str) -> str:
+    """Return the site top bar with ``active`` highlighted; shared by every publisher with this layout."""
+    nav_links = [("/index.html", "Home", "/index.html")] + [
+        (build_category_path(category, url_schema), CATEGORY_LABELS.get(category, category), category)
+        for category in ALL_CATEGORIES
+    ]
+    link_tags: list[str] = []
+    for href, label, key in nav_links:
+        is_active = key == active
+        class_attr = ' class="is-active"' if is_active else ""
+        aria = ' aria-current="page"' if is_active else ""
+        link_tags.append(
+            f'<a{class_attr} href="{html.escape(_join_href(base_path, href))}"{aria}>{html.escape(label)}</a>'
+        )
+    links_html = "".join(link_tags)
+    return f"""
+  <header class=\"site-topbar\">
+    <div class=\"site-topbar-inner\">
+      <a class=\"site-brand\" href=\"{_join_href(base_path, '/index.html')}\"><span class=\"site-brand-dot\" aria-hidden=\"true\"></span>{_ESC_PROJECT_TITLE}</a>
+      <nav class=\"site-topnav\" aria-label=\"Primary\">
+        {links_html}
+      </nav>
+    </div>
+  </header>"""
+
+
+@functools.lru_cache(maxsize=16)
+def _category_nav_html(base_path: str, url_schema: str) -> str:
+    return "".join(
+        [
+            f"<a href=\"{html.escape(_join_href(base_path, build_category_path(category, url_schema)))}\">{_esc_category_label(category)}</a>"
+            for category in ALL_CATEGORIES
+        ]
+    )
+
+
+def _sitemap_entry(esc_url: str, lastmod: str) -> str:
+    if lastmod:
+        return f"  <url><loc>{esc_url}</loc><lastmod>{_esc(lastmod)}</lastmod></url>"
+    return f"  <url><loc>{esc_url}</loc></url>"
+
+
+@functools.lru_cache(maxsize=4096)
+def _join_href(base_path: str, path: str) -> str:
+    return base_path + path if path.startswith("/") else f"{base_path}/{path}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _join_public_url(site_url: str, path: str) -> str:
+    if path.startswith("http://") or path.startswith("https://"):
+        return path
+    normalized = path if path.startswith("/") else f"/{path}"
+    return f"{site_url}{normalized}"
+
+
+def _url_base_path(url: str) -> str:
+    """Path component of an absolute URL without its trailing slash ("" for a bare host)."""
+    rest = url.partition("://")[2] or url
+    rest = rest.split("?", 1)[0].split("#", 1)[0]
+    slash = rest.find("/")
+    return "" if slash < 0 else rest[slash:].rstrip("/")
+
+
+def _clone_file(source: str | Path, target: Path) -> None:
+    """Give target the contents of source without copying data when the filesystem allows it."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data with raw file I/O; whole pages are already in memory, so buffering only adds a copy."""
+    view = memoryview(data)
+    with open(path, "wb", buffering=0) as handle:
+        while view:
+            view = view[handle.write(view):]
+
+
+def _write_if_changed(path: Path, data: bytes, live_path: str) -> None:
+    """Link the live site's copy when it already holds exactly these bytes; write otherwise."""
+    try:
+        if os.stat(live_path).st_size == len(data):
+            with open(live_path, "rb", buffering=0) as handle:
+                same = handle.read() == data
+            if same:
+                _clone_file(live_path, path)
+                return
+    except OSError:
+        pass
+    _write_bytes(path, data)
+
+
+def build_story_path(category: str, slug: str, schema: str = DEFAULT_URL_SCHEMA) -> str:
+    if schema == URL_SCHEMA_V2:
+        return STORY_PATH_PATTERN_V2.format(category=category, slug=slug)
+    return f"/category/{category}/{slug}.html"
+
+
+def build_category_path(category: str, schema: str = DEFAULT_URL_SCHEMA) -> str:
+    if schema == URL_SCHEMA_V2:
+        return TOPIC_PATH_PATTERN_V2.format(category=category)
+    return f"/category/{category}/index.html"
+
+
+class StaticSitePublisher:
+    def __init__(
+        self,
+        site_dir: str,
+        site_url: str | None = None,
+        adsense_client: str | None = None,
+        url_schema: str | None = None,
+        theme_variant: str | None = None,
+    ):
+        self.site_dir = Path(site_dir)
+        self.site_url = (
+            site_url
+            or os.getenv("SIGNAL_ATLAS_SITE_URL")
+            or os.getenv("AUTOTREND_SITE_URL")
+            or "https://signal-atlas.example.com"
+        ).rstrip("/")
+        self.adsense_client = adsense_client or os.getenv("ADSENSE_CLIENT_ID") or "ca-pub-REPLACE_ME"
+        self.url_schema = str(url_schema or os.getenv("URL_SCHEMA") or DEFAULT_URL_SCHEMA).strip().lower() or DEFAULT_URL_SCHEMA
+        self.theme_variant = str(theme_variant or os.getenv("THEME_VARIANT") or THEME_MAGAZINE_V2).strip() or THEME_MAGAZINE_V2
+        self.base_path = _url_base_path(self.site_url)
+        self._breadcrumb_prefixes: dict[str, str] = {}
+        self._made_dirs: set[Path] = set()
+        self._cloned_paths: set[Path] = set()
+        self._discard_threads: list[threading.Thread] = []
+        self._category_nav_html = _category_nav_html(self.base_path, self.url_schema)
+        self._esc_rss_href = html.escape(self._href("/rss.xml"))
+        self._esc_category_urls = tuple(
+            (category, _esc(f"{self.site_url}{build_category_path(category, self.url_schema)}"))
+            for category in ALL_CATEGORIES
+        )
+        self._page_head_close = (
+            f"  <link rel=\"stylesheet\" href=\"{self._href('/assets/site.css')}\" />\n"
+            f"  <script async src=\"https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client={html.escape(self.adsense_client)}\" crossorigin=\"anonymous\"></script>\n"
+            "</head>\n"
+            "<body>\n"
+            "  <a class=\"skip-link\" href=\"#main-content\">Skip to content</a>\n  "
+        )
+
+    def publish(
+        self,
+        generated_briefs: list[GeneratedBrief],
+        existing_rows: Iterable[dict],
+        now_iso: str,
+    ) -> list[PublishedBrief]:
+        existing_posts = self._load_existing_rows(existing_rows)
+        existing_by_slug = {post.slug: post for post in existing_posts}
+        new_posts: list[PublishedBrief] = []
+
+        staging = self.site_dir.parent / f"{self.site_dir.name}.staging"
+        # A unique, already-discardable name: the old site is deleted straight from here after the swap.
+        backup = self.site_dir.parent / f"{self.site_dir.name}.backup.old.{os.urandom(4).hex()}"
+        stale_backup = self.site_dir.parent / f"{self.site_dir.name}.backup"
+
+        # Let the previous publish's deletes finish so the sweep never races them.
+        self._join_discards()
+        # Only the exact names _discard_tree and the backup swap produce; other siblings are not ours.
+        leftover_name = re.compile(rf"{re.escape(self.site_dir.name)}\.(?:backup|staging)\.old\.[0-9a-f]{{8}}")
+        for leftover in self.site_dir.parent.glob(f"{self.site_dir.name}.*.old.*"):
+            if leftover_name.fullmatch(leftover.name):
+                self._discard_tree(leftover)
+        if stale_backup.exists():
+            self._discard_tree(stale_backup)
+        if staging.exists():
+            self._discard_tree(staging)
+        self._made_dirs.clear()
+        self._cloned_paths.clear()
+        ensure_dir(staging)
+        self._cleanup_legacy_pages(staging)
+
+        # Rendered files are queued here and flushed together; a later entry for a path wins.
+        writes: dict[Path, bytes] = {}
+        self._queue_shared_assets(writes, staging)
+
+        generated_by_slug: dict[str, GeneratedBrief] = {}
+        used_paths = {post.path for post in existing_posts}
+        for brief in generated_briefs:
+            slug = brief.slug
+            old = existing_by_slug.get(brief.slug)
+            path = build_story_path(brief.topic.category, slug, self.url_schema)
+            if old and old.category == brief.topic.category:
+                path = old.path
+                used_paths.discard(path)
+            else:
+                suffix = 2
+                while path in used_paths:
+                    slug = f"{brief.slug}-{suffix}"
+                    path = build_story_path(brief.topic.category, slug, self.url_schema)
+                    suffix += 1
+            used_paths.add(path)
+            brief.slug = slug
+            brief.payload["slug"] = slug
+            primary_image = str(brief.payload.get("hero_image_url") or f"/assets/covers/{brief.topic.category}.svg")
+            legacy_paths: list[str] = []
+            if old:
+                for legacy in [old.path, *old.legacy_paths]:
+                    one = str(legacy or "").strip()
+                    if one and one != path and one not in legacy_paths:
+                        legacy_paths.append(one)
+            default_legacy = f"/category/{brief.topic.category}/{slug}.html"
+            if self.url_schema == URL_SCHEMA_V2 and default_legacy != path and default_legacy not in legacy_paths:
+                legacy_paths.append(default_legacy)
+            published = PublishedBrief(
+                slug=slug,
+                vertical=brief.topic.vertical,
+                title=brief.topic.title,
+                published_at=now_iso,
+                word_count=brief.word_count,
+                source_urls=list(brief.payload.get("source_urls") or brief.topic.source_urls),
+                ad_slots=list(ADSENSE_SLOTS),
+                dedupe_hash=brief.topic.dedupe_hash,
+                path=path,
+                category=brief.topic.category,
+                primary_image=primary_image,
+                seo_title=str(brief.payload.get("seo_title") or brief.topic.title),
+                meta_description=str(brief.payload.get("meta_description") or PROJECT_TAGLINE),
+                legacy_paths=legacy_paths,
+                url_schema=self.url_schema,
+                template_version=self.theme_variant,
+            )
+            published.primary_image = self._localize_primary_image(published, staging)
+            brief.payload["hero_image_url"] = published.primary_image
+            new_posts.append(published)
+            generated_by_slug[published.slug] = brief
+
+        all_posts = self._merge_posts(existing_posts, new_posts)
+        for post in all_posts:
+            post.primary_image = self._localize_primary_image(post, staging)
+        all_posts.sort(key=lambda p: str(p.published_at), reverse=True)
+        views = self._make_views(all_posts)
+        # Buckets inherit the date order of all_posts.
+        views_by_category: dict[str, list[_PostView]] = {category: [] for category in ALL_CATEGORIES}
+        for view in views:
+            views_by_category.setdefault(view.post.category, []).append(view)
+
+        # Render every post page from state + generated payload (no legacy file mutation flow).
+        # Paths are unique, so the first seven same-category posts always cover six links.
+        link_candidates = {category: bucket[:7] for category, bucket in views_by_category.items()}
+        self._ensure_dir_once(staging / "assets" / "thumbs")
+        for post in all_posts:
+            brief = generated_by_slug.get(post.slug) or self._fallback_generated_brief(post, now_iso=now_iso)
+            internal_links = [v for v in link_candidates[post.category] if v.post.path != post.path][:6]
+            out_path = staging / post.path.lstrip("/")
+            self._ensure_dir_once(out_path.parent)
+            writes[out_path] = self._render_post_html(brief, post, internal_links).encode("utf-8")
+            writes[staging / self._thumbnail_relpath(post).lstrip("/")] = self._build_post_thumbnail_svg(post).encode("utf-8")
+            for legacy_path in post.legacy_paths:
+                self._queue_redirect(writes, staging, legacy_path, post.path)
+
+        # Render aggregate pages.
+        writes[staging / "index.html"] = self._render_home_html(views).encode("utf-8")
+        for category in ALL_CATEGORIES:
+            category_views = views_by_category[category]
+            category_path = build_category_path(category, self.url_schema)
+            out_path = staging / category_path.lstrip("/")
+            self._ensure_dir_once(out_path.parent)
+            writes[out_path] = self._render_category_html(category, category_views).encode("utf-8")
+            if self.url_schema == URL_SCHEMA_V2:
+                self._queue_redirect(writes, staging, f"/category/{category}/index.html", category_path)
+
+        writes[staging / "robots.txt"] = self._render_robots().encode("utf-8")
+        writes[staging / "sitemap.xml"] = self._render_sitemap(views).encode("utf-8")
+        writes[staging / "rss.xml"] = self._render_rss(views).encode("utf-8")
+        self._flush_writes(writes, staging)
+
+        try:
+            if self.site_dir.exists():
+                self.site_dir.replace(backup)
+            staging.replace(self.site_dir)
+        except Exception:
+            if self.site_dir.exists() and self.site_dir != staging:
+                shutil.rmtree(self.site_dir, ignore_errors=True)
+            if backup.exists():
+                backup.replace(self.site_dir)
+            raise
+        finally:
+            # Cached directories refer to the staging tree, which no longer exists.
+            self._made_dirs.clear()
+        if backup.exists():
+            self._discard_tree(backup)
+
+        return new_posts
+
+    def _flush_writes(self, writes: dict[Path, bytes], root: Path | None = None) -> None:
+        """Write queued files; larger batches overlap their I/O on a thread pool.
+
+        With a staging root, files whose bytes match the live site are linked from it instead.
+        """
+        # Break shared links first so a rewrite never reaches the live site's inode.
+        for path in self._cloned_paths.intersection(writes):
+            path.unlink(missing_ok=True)
+        if root is None or root == self.site_dir or not self.site_dir.is_dir():
+            write = _write_bytes
+        else:
+            # Every queued path lies under root; slicing its string form skips a relative_to per file.
+            live_root = os.fspath(self.site_dir)
+            offset = len(os.fspath(root)) + 1
+
+            def write(path: Path, data: bytes) -> None:
+                _write_if_changed(path, data, os.path.join(live_root, os.fspath(path)[offset:]))
+
+        items = list(writes.items())
+        workers = min(os.cpu_count() or 1, _WRITE_MAX_WORKERS)
+        if len(items) < _PARALLEL_WRITE_MIN_FILES or workers <= 1:
+            for path, data in items:
+                write(path, data)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(lambda item: write(*item), items):
+                pass
+
+    def _ensure_dir_once(self, path: Path) -> None:
+        """Create a directory at most once per publish; many pages share a parent."""
+        if path not in self._made_dirs:
+            ensure_dir(path)
+            self._made_dirs.add(path)
+
+    def _discard_tree(self, path: Path) -> None:
+        """Rename a tree aside and delete it off the publish critical path."""
+        if ".old." in path.name:
+            trash = path
+        else:
+            trash = path.with_name(f"{path.name}.old.{os.urandom(4).hex()}")
+            try:
+                path.rename(trash)
+            except OSError:
+                shutil.rmtree(path, ignore_errors=True)
+                return
+        # Not a daemon: the interpreter waits for the delete, so no trees are left behind on exit.
+        thread = threading.Thread(
+            target=shutil.rmtree,
+            args=(trash,),
+            kwargs={"ignore_errors": True},
+            name=f"discard-{trash.name}",
+        )
+        thread.start()
+        self._discard_threads.append(thread)
+
+    def _join_discards(self) -> None:
+        """Wait for background tree deletes started by earlier publishes."""
+        for thread in self._discard_threads:
+            thread.join()
+        self._discard_threads.clear()
+
+    def _load_existing_rows(self, rows: Iterable[dict]) -> list[PublishedBrief]:
+        out: list[PublishedBrief] = []
+        for row in rows:
+            try:
+                slug = str(row["slug"])
+                category = str(row.get("category") or row.get("subcategory") or "general")
+                path = build_story_path(category, slug, self.url_schema)
+                out.append(
+                    PublishedBrief(
+                        slug=slug,
+                        vertical=str(row.get("vertical") or ""),
+                        title=str(row["title"]),
+                        published_at=str(row["published_at"]),
+                        word_count=int(row.get("word_count") or 0),
+                        source_urls=list(row.get("source_urls") or []),
+                        ad_slots=list(row.get("ad_slots") or []),
+                        dedupe_hash=str(row.get("dedupe_hash") or ""),
+                        path=path,
+                        category=category,
+                        primary_image=str(row.get("primary_image") or ""),
+                        seo_title=str(row.get("seo_title") or row.get("title") or ""),
+                        meta_description=str(row.get("meta_description") or PROJECT_TAGLINE),
+                        legacy_paths=[
+                            one
+                            for one in [str(row.get("path") or "")] + [str(item) for item in list(row.get("legacy_paths") or [])]
+                            if one and one != path
+                        ],
+                        url_schema=str(row.get("url_schema") or self.url_schema),
+                        template_version=str(row.get("template_version") or self.theme_variant),
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return out
+
+    def _merge_posts(self, existing: list[PublishedBrief], new: list[PublishedBrief]) -> list[PublishedBrief]:
+        # The path-keyed dict is load-bearing: it collapses duplicate state rows and keeps a
+        # republished post at its original position, which the stable date sort relies on for ties.
+        merged: dict[str, PublishedBrief] = {row.path: row for row in existing}
+        for row in new:
+            prior = merged.get(row.path)
+            if prior:
+                # dict.fromkeys keeps first-seen order while deduplicating in one pass.
+                row.legacy_paths = list(
+                    dict.fromkeys(one for one in (*prior.legacy_paths, *row.legacy_paths) if one and one != row.path)
+                )
+            merged[row.path] = row
+        return list(merged.values())
+
+    def _cleanup_legacy_pages(self, root: Path) -> None:
+        for vertical in ALL_VERTICALS:
+            old_dir = root / vertical
+            if old_dir.exists():
+                shutil.rmtree(old_dir, ignore_errors=True)
+        legacy_category_root = root / "category"
+        if legacy_category_root.exists():
+            shutil.rmtree(legacy_category_root, ignore_errors=True)
+
+    def write_redirect_page(self, root: Path, from_path: str, to_path: str) -> None:
+        output = self._redirect_output(root, from_path, to_path)
+        if output:
+            _write_bytes(output[0], output[1].encode("utf-8"))
+
+    def _queue_redirect(self, writes: dict[Path, bytes], root: Path, from_path: str, to_path: str) -> None:
+        output = self._redirect_output(root, from_path, to_path)
+        if output:
+            writes[output[0]] = output[1].encode("utf-8")
+
+    def _redirect_output(self, root: Path, from_path: str, to_path: str) -> tuple[Path, str] | None:
+        src = str(from_path or "").strip()
+        dst = str(to_path or "").strip()
+        if not src or not dst or src == dst:
+            return None
+        if not src.startswith("/"):
+            src = f"/{src}"
+        if not dst.startswith("/"):
+            dst = f"/{dst}"
+        out_path = root / src.lstrip("/")
+        self._ensure_dir_once(out_path.parent)
+        target = self._href(dst)
+        esc_target = html.escape(target)
+        return out_path, (
+            f"{_REDIRECT_HEAD}<meta http-equiv=\"refresh\" content=\"0;url={esc_target}\" />"
+            f"<link rel=\"canonical\" href=\"{html.escape(self._public_url(dst))}\" />"
+            f"{_REDIRECT_MIDDLE}<p>Redirecting to <a href=\"{esc_target}\">{esc_target}</a></p>"
+            f"<script>location.replace({json.dumps(target)});</script></body></html>\n"
+        )
+
+    def _fallback_generated_brief(self, post: PublishedBrief, *, now_iso: str) -> GeneratedBrief:
+        source_urls = list(post.source_urls or [])
+        if len(source_urls) < 3:
+            source_urls.extend(
+                [
+                    f"https://news.google.com/rss/search?q={urllib.parse.quote_plus(post.title)}",
+                    f"https://www.bing.com/news/search?q={urllib.parse.quote_plus(post.title)}",
+                    f"https://duckduckgo.com/?q={urllib.parse.quote_plus(post.title)}&ia=news",
+                ][: 3 - len(source_urls)]
+            )
+
+        topic = ApprovedTopic(
+            id=f"fallback-{post.slug}",
+            vertical=post.vertical,
+            title=post.title,
+            source_urls=source_urls,
+            discovered_at=post.published_at or now_iso,
+            confidence_score=0.8,
+            policy_score=0.95,
+            dedupe_hash=post.dedupe_hash or f"fallback-{post.slug}",
+            category=post.category,
+            snippet=post.meta_description or PROJECT_TAGLINE,
+        )
+        summary = post.meta_description or f"{post.title} is a trend signal in {CATEGORY_LABELS.get(post.category, post.category)}."
+        payload = {
+            "slug": post.slug,
+            "title": post.title,
+            "vertical": post.vertical,
+            "category": post.category,
+            "category_label": CATEGORY_LABELS.get(post.category, post.category),
+            "seo_title": post.seo_title or f"{post.title} | {PROJECT_TITLE}",
+            "meta_description": post.meta_description or PROJECT_TAGLINE,
+            "summary": summary,
+            "key_points": [
+                "Market attention around this topic has increased across multiple outlets.",
+                "Operators should track follow-up releases and execution evidence.",
+                "The directional signal is useful only when validated with source continuity.",
+                "Short-term hype should be separated from durable demand indicators.",
+            ],
+            "deep_dive": [
+                f"{summary} The operational takeaway is to monitor whether the trend sustains across two or more cycles.",
+                "Teams should validate signal strength through repeated source confirmations and measurable outcomes.",
+            ],
+            "implications": [
+                "Commercially, this can influence roadmap sequencing and go-to-market timing.",
+                "Operationally, this highlights the need for disciplined tracking and evidence-based decisions.",
+            ],
+            "contrarian_view": "A contrarian read is that short-lived momentum can revert quickly without durable adoption.",
+            "faq": [
+                {
+                    "q": "Why does this matter now?",
+                    "a": "The topic appears repeatedly across sources, suggesting actionable timing signals.",
+                },
+                {
+                    "q": "What should teams monitor next?",
+                    "a": "Track follow-up releases, implementation evidence, and consistency in source coverage.",
+                },
+                {
+                    "q": "What is the main risk?",
+                    "a": "The main risk is overreacting to temporary attention spikes.",
+                },
+            ],
+            "source_urls": source_urls,
+            "hero_image_url": post.primary_image or f"/assets/covers/{post.category}.svg",
+            "hero_image_alt": f"{post.title} trend coverage",
+            "disclaimer": "",
+            "ad_slots": list(ADSENSE_SLOTS),
+            "reading_time": max(1, round(max(1, post.word_count) / 220)),
+            "json_ld": {},
+            "generation_engine": "template",
+            "quality_tier": "balanced",
+        }
+        return GeneratedBrief(
+            topic=topic,
+            slug=post.slug,
+            markdown=f"# {post.title}\n\n{summary}\n",
+            payload=payload,
+            word_count=max(900, int(post.word_count or 0)),
+        )
+
+    def _guess_image_ext(self, url: str, content_type: str = "") -> str:
+        mime_map = {
+            "image/jpeg": ".jpg",
+            "image/jpg": ".jpg",
+            "image/png": ".png",
+            "image/webp": ".webp",
+            "image/gif": ".gif",
+            "image/avif": ".avif",
+        }
+        if content_type in mime_map:
+            return mime_map[content_type]
+        path = urllib.parse.urlparse(url).path.lower()
+        for ext in (".jpg", ".jpeg", ".png", ".webp", ".gif", ".avif"):
+            if path.endswith(ext):
+                return ".jpg" if ext == ".jpeg" else ext
+        return ".jpg"
+
+    def _localize_primary_image(self, post: PublishedBrief, root: Path) -> str:
+        fallback = f"/assets/covers/{post.category}.svg"
+        current = str(post.primary_image or "").strip()
+        if not current:
+            return fallback
+        if current.startswith("/"):
+            if current.startswith("/assets/images/"):
+                self._link_from_live_site(current.lstrip("/"), root)
+            return current
+        if not (current.startswith("http://") or current.startswith("https://")):
+            return fallback
+
+        images_dir = root / "assets" / "images"
+        self._ensure_dir_once(images_dir)
+
+        existing_ext = self._guess_image_ext(current)
+        existing_name = f"{post.slug}{existing_ext}"
+        if self._link_from_live_site(f"assets/images/{existing_name}", root):
+            return f"/assets/images/{existing_name}"
+
+        try:
+            req = urllib.request.Request(
+                current,
+                headers={
+                    "User-Agent": "Mozilla/5.0 (SignalAtlas/1.0)",
+                    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+                },
+            )
+            with urllib.request.urlopen(req, timeout=8) as resp:
+                content_type = (resp.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+                if not content_type.startswith("image/"):
+                    return fallback
+                blob = resp.read(2_500_001)
+            if not blob or len(blob) > 2_500_000:
+                return fallback
+            ext = self._guess_image_ext(current, content_type)
+            filename = f"{post.slug}{ext}"
+            out_path = images_dir / filename
+            out_path.write_bytes(blob)
+            return f"/assets/images/{filename}"
+        except Exception:
+            return fallback
+
+    def _link_from_live_site(self, relpath: str, root: Path) -> bool:
+        """Hardlink an already-fetched file from the live site into root instead of re-fetching it."""
+        target = root / relpath
+        if target.exists():
+            return True
+        source = self.site_dir / relpath
+        if root == self.site_dir or not source.is_file():
+            return False
+        ensure_dir(target.parent)
+        _clone_file(source, target)
+        self._cloned_paths.add(target)
+        return True
+
+    def _thumbnail_relpath(self, post: PublishedBrief) -> str:
+        return f"/assets/thumbs/{post.slug}.svg"
+
+    def _split_lines(self, text: str, *, max_chars: int, max_lines: int) -> list[str]:
+        compact = " ".join(str(text or "").split()).strip()
+        if not compact:
+            return []
+        words = compact.split(" ")
+        lines: list[str] = []
+        current = ""
+        truncated = False
+
+        for word in words:
+            if len(word) > max_chars:
+                if current:
+                    lines.append(current)
+                    current = ""
+                    if len(lines) >= max_lines:
+                        truncated = True
+                        break
+                lines.append(word[: max_chars - 3].rstrip() + "...")
+                if len(lines) >= max_lines:
+                    truncated = True
+                    break
+                continue
+
+            candidate = word if not current else f"{current} {word}"
+            if len(candidate) <= max_chars:
+                current = candidate
+                continue
+
+            lines.append(current)
+            if len(lines) >= max_lines:
+                truncated = True
+                break
+            current = word
+
+        if not truncated and current:
+            if len(lines) < max_lines:
+                lines.append(current)
+            else:
+                truncated = True
+
+        if truncated and lines and not lines[-1].endswith("..."):
+            lines[-1] = lines[-1][: max(1, max_chars - 3)].rstrip() + "..."
+        return lines[:max_lines]
+
+    def _build_post_thumbnail_svg(self, post: PublishedBrief) -> str:
+        c1, c2 = _COVER_COLORS.get(post.category, _COVER_COLORS["general"])
+        category_label = CATEGORY_LABELS.get(post.category, post.category).upper()
+        title_lines = self._split_lines(post.title, max_chars=34, max_lines=3) or ["Signal Atlas Brief"]
+        desc_seed = post.meta_description or PROJECT_TAGLINE
+        desc_lines = self._split_lines(desc_seed, max_chars=46, max_lines=2)
+
+        title_y = 238
+        title_line_height = 68
+        desc_y = title_y + title_line_height * len(title_lines) + 28
+        desc_line_height = 38
+
+        title_tspans = "".join(
+            [
+                f"<tspan x='96' y='{title_y + idx * title_line_height}'>{html.escape(line)}</tspan>"
+                for idx, line in enumerate(title_lines)
+            ]
+        )
+        desc_tspans = "".join(
+            [
+                f"<tspan x='96' y='{desc_y + idx * desc_line_height}'>{html.escape(line)}</tspan>"
+                for idx, line in enumerate(desc_lines)
+            ]
         )
+        published = html.escape(str(post.published_at)[:10])
 
-        for category in ALL_CATEGORIES:
-            c1, c2 = _COVER_COLORS.get(category, _COVER_COLORS["general"])
-            label = CATEGORY_LABELS.get(category, category).upper()
-            svg = f"""<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 1200 675' role='img' aria-label='{html.escape(label)}'>
-<defs><linearGradient id='g' x1='0' y1='0' x2='1' y2='1'><stop offset='0%' stop-color='{c1}'/><stop offset='100%' stop-color='{c2}'/></linearGradient></defs>
+        return f"""<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 1200 675' role='img' aria-label='{html.escape(post.title)}'>
+<defs>
+  <linearGradient id='g' x1='0' y1='0' x2='1' y2='1'>
+    <stop offset='0%' stop-color='{c1}'/>
+    <stop offset='100%' stop-color='{c2}'/>
+  </linearGradient>
+  <linearGradient id='mask' x1='0' y1='0' x2='0' y2='1'>
+    <stop offset='0%' stop-color='rgba(15,23,42,.1)'/>
+    <stop offset='100%' stop-color='rgba(15,23,42,.76)'/>
+  </linearGradient>
+</defs>
 <rect width='1200' height='675' fill='url(#g)'/>
-<circle cx='1040' cy='120' r='220' fill='rgba(255,255,255,.15)'/>
-<circle cx='140' cy='560' r='240' fill='rgba(255,255,255,.12)'/>
-<text x='72' y='570' fill='rgba(255,255,255,.95)' font-family='Georgia,serif' font-size='72' letter-spacing='2'>{html.escape(label)}</text>
+<rect width='1200' height='675' fill='url(#mask)'/>
+<circle cx='1070' cy='110' r='170' fill='rgba(255,255,255,.16)'/>
+<circle cx='105' cy='600' r='210' fill='rgba(255,255,255,.1)'/>
+<rect x='64' y='78' width='800' height='520' rx='28' fill='rgba(2,6,23,.62)' stroke='rgba(255,255,255,.17)' stroke-width='2'/>
+<rect x='96' y='112' width='240' height='44' rx='22' fill='rgba(255,255,255,.94)'/>
+<text x='216' y='141' text-anchor='middle' fill='#0f172a' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='24' font-weight='700' letter-spacing='1'>{html.escape(category_label)}</text>
+<text x='96' y='{title_y}' fill='#f8fafc' font-family='Newsreader,Georgia,serif' font-size='58' font-weight='700' letter-spacing='.2'>
+  {title_tspans}
+</text>
+<text x='96' y='{desc_y}' fill='rgba(241,245,249,.95)' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='30' font-weight='600'>
+  {desc_tspans}
+</text>
+<text x='96' y='560' fill='rgba(226,232,240,.95)' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='24'>Published {published}</text>
+<text x='1112' y='620' text-anchor='end' fill='rgba(241,245,249,.94)' font-family='Source Sans 3,Segoe UI,sans-serif' font-size='26' letter-spacing='2'>SIGNAL ATLAS</text>
 </svg>"""
-            (covers_dir / f"{category}.svg").write_text(svg, encoding="utf-8")
+
+    def _article_cover_block(self, *, category: str, title: str, description: str) -> str:
+        safe_title = html.escape(str(title or ""))
+        safe_desc = html.escape(str(description or PROJECT_TAGLINE))
+        safe_category = html.escape(str(category))
+        safe_label = _esc_category_label(str(category))
+        return (
+            f'<div class="article-cover featured-media featured-media-text" data-category="{safe_category}">'
+            f'<span class="featured-media-inner">'
+            f'<span class="cover-chip">{safe_label}</span>'
+            f'<strong class="cover-title">{safe_title}</strong>'
+            f'<span class="cover-desc">{safe_desc}</span>'
+            f'</span></div>'
+        )
+
+    def _refresh_existing_post_layouts(self, root: Path, posts: list[PublishedBrief]) -> None:
+        hero_pattern = re.compile(r'<img class="hero-image"[^>]*?>', re.IGNORECASE)
+        topbar_pattern = re.compile(r'<header class="site-topbar">.*?</header>', re.IGNORECASE | re.DOTALL)
+        skip_link_markup = '  <a class="skip-link" href="#main-content">Skip to content</a>'
+        for post in posts:
+            post_file = root / post.path.lstrip("/")
+            if not post_file.exists():
+                continue
+            try:
+                blob = post_file.read_text(encoding="utf-8")
+            except OSError:
+                continue
+            rewritten = blob
+            if 'class="hero-image"' in rewritten:
+                replacement = self._article_cover_block(
+                    category=post.category,
+                    title=post.title,
+                    description=post.meta_description or PROJECT_TAGLINE,
+                )
+                rewritten = hero_pattern.sub(replacement, rewritten, count=1)
+
+            if "<h2>Sources</h2>" in rewritten:
+                rewritten = rewritten.replace("<h2>Sources</h2>\n  <ul>", '<h2>Sources</h2>\n  <ul class="source-list">', 1)
+                rewritten = rewritten.replace("<li><code>", '<li class="source-item"><code>')
+
+            topbar_html = self._render_topbar(canonical_path=post.path).strip()
+            if '<header class="site-topbar">' in rewritten:
+                rewritten = topbar_pattern.sub(topbar_html, rewritten, count=1)
+            elif "<body>" in rewritten:
+                rewritten = rewritten.replace("<body>", f"<body>\n{topbar_html}", 1)
+
+            if 'class="skip-link"' not in rewritten and "<body>" in rewritten:
+                rewritten = rewritten.replace("<body>", f"<body>\n{skip_link_markup}", 1)
+            if '<main id="main-content">' not in rewritten:
+                rewritten = rewritten.replace("<main>", '<main id="main-content">', 1)
+
+            # Normalize legacy absolute URLs and root-relative links for current deployment base path.
+            if "https://signal-atlas.example.com" in rewritten:
+                rewritten = rewritten.replace("https://signal-atlas.example.com", self.site_url)
+            rewritten = self._rewrite_root_relative_links(rewritten)
+
+            if rewritten != blob:
+                post_file.write_text(rewritten, encoding="utf-8")
+
+    def _queue_shared_assets(self, writes: dict[Path, bytes], root: Path) -> None:
+        css_dir = root / "assets"
+        covers_dir = css_dir / "covers"
+        ensure_dir(covers_dir)
+
+        writes[css_dir / "site.css"] = _SITE_CSS
+        for category in ALL_CATEGORIES:
+            writes[covers_dir / f"{category}.svg"] = _cover_svg(category)
 
     def _href(self, path: str) -> str:
-        normalized = path if path.startswith("/") else f"/{path}"
-        return f"{self.base_path}{normalized}" if self.base_path else normalized
+        return _join_href(self.base_path, path)
 
     def _rewrite_root_relative_links(self, blob: str) -> str:
         if not self.base_path:
@@ -994,12 +1303,12 @@ nav.categories a {
         return pattern.sub(_inject, blob)
 
     def _public_url(self, path: str) -> str:
-        if path.startswith("http://") or path.startswith("https://"):
-            return path
-        normalized = path if path.startswith("/") else f"/{path}"
-        return f"{self.site_url}{normalized}"
+        return _join_public_url(self.site_url, path)
 
     def _ad_slot(self, slot: str) -> str:
+        cached = _AD_SLOT_HTML.get(slot)
+        if cached is not None:
+            return cached
         return f"<div class=\"ad-slot\" data-slot=\"{html.escape(slot)}\">AdSense Slot: {html.escape(slot)}</div>"
 
     def _seo_head(
@@ -1010,69 +1319,38 @@ nav.categories a {
         canonical_path: str,
         og_type: str = "website",
         og_image: str = "",
-        json_ld_objects: list[dict] | None = None,
+        json_ld_objects: list[dict | str] | None = None,
     ) -> str:
         canonical_url = self._public_url(canonical_path)
-        image_url = self._public_url(og_image) if og_image else ""
-        json_ld = ""
+        scripts: list[str] = []
         for one in json_ld_objects or []:
-            blob = json.dumps(one, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
-            json_ld += "\n" + f"<script type=\"application/ld+json\">{blob}</script>"
-
-        og_image_tag = f'<meta property="og:image" content="{html.escape(image_url)}" />' if image_url else ""
-        tw_image_tag = f'<meta name="twitter:image" content="{html.escape(image_url)}" />' if image_url else ""
-
-        return f"""
-  <meta name=\"description\" content=\"{html.escape(description)}\" />
-  <meta name=\"robots\" content=\"index, follow, max-image-preview:large\" />
-  <meta name=\"theme-color\" content=\"#0f172a\" />
-  <link rel=\"canonical\" href=\"{html.escape(canonical_url)}\" />
-  <link rel=\"alternate\" hreflang=\"en\" href=\"{html.escape(canonical_url)}\" />
-  <link rel=\"alternate\" type=\"application/rss+xml\" title=\"{html.escape(PROJECT_TITLE)} RSS\" href=\"{html.escape(self._href('/rss.xml'))}\" />
-  <meta property=\"og:type\" content=\"{html.escape(og_type)}\" />
-  <meta property=\"og:site_name\" content=\"{html.escape(PROJECT_TITLE)}\" />
-  <meta property=\"og:title\" content=\"{html.escape(title)}\" />
-  <meta property=\"og:description\" content=\"{html.escape(description)}\" />
-  <meta property=\"og:url\" content=\"{html.escape(canonical_url)}\" />
-  {og_image_tag}
-  <meta name=\"twitter:card\" content=\"summary_large_image\" />
-  <meta name=\"twitter:title\" content=\"{html.escape(title)}\" />
-  <meta name=\"twitter:description\" content=\"{html.escape(description)}\" />
-  {tw_image_tag}
-  <link rel=\"preconnect\" href=\"https://fonts.googleapis.com\" />
-  <link rel=\"preconnect\" href=\"https://fonts.gstatic.com\" crossorigin />
-  <link href=\"https://fonts.googleapis.com/css2?family=Newsreader:wght@500;700&family=Source+Sans+3:wght@400;600;700&display=swap\" rel=\"stylesheet\" />
-  {json_ld}
-"""
+            # Strings are JSON that was already serialized by the caller.
+            blob = one if isinstance(one, str) else dumps_json_compact(one)
+            blob = blob.replace("</", "<\\/")
+            scripts.append(f"\n<script type=\"application/ld+json\">{blob}</script>")
+        json_ld = "".join(scripts)
+
+        return _seo_head_template(og_type, bool(og_image)).format(
+            title=html.escape(title),
+            description=html.escape(description),
+            canonical_url=html.escape(canonical_url),
+            image_url=html.escape(self._public_url(og_image)) if og_image else "",
+            rss_href=self._esc_rss_href,
+            json_ld=json_ld,
+        )
 
     def _render_topbar(self, *, canonical_path: str) -> str:
-        nav_links = [("/index.html", "Home", "")] + [
-            (build_category_path(category, self.url_schema), CATEGORY_LABELS.get(category, category), category)
-            for category in ALL_CATEGORIES
-        ]
-        link_tags: list[str] = []
-        for href, label, category in nav_links:
-            is_active = False
-            if href == "/index.html":
-                is_active = canonical_path == "/index.html"
-            else:
-                story_prefix = f"/stories/{category}/"
-                is_active = canonical_path == href or canonical_path.startswith(story_prefix)
-            class_attr = ' class="is-active"' if is_active else ""
-            aria = ' aria-current="page"' if is_active else ""
-            link_tags.append(
-                f'<a{class_attr} href="{html.escape(self._href(href))}"{aria}>{html.escape(label)}</a>'
-            )
-        links_html = "".join(link_tags)
-        return f"""
-  <header class=\"site-topbar\">
-    <div class=\"site-topbar-inner\">
-      <a class=\"site-brand\" href=\"{self._href('/index.html')}\"><span class=\"site-brand-dot\" aria-hidden=\"true\"></span>{html.escape(PROJECT_TITLE)}</a>
-      <nav class=\"site-topnav\" aria-label=\"Primary\">
-        {links_html}
-      </nav>
-    </div>
-  </header>"""
+        return _topbar_html(self.base_path, self.url_schema, self._active_nav_key(canonical_path))
+
+    def _active_nav_key(self, canonical_path: str) -> str:
+        if canonical_path == "/index.html":
+            return canonical_path
+        for category in ALL_CATEGORIES:
+            if canonical_path == build_category_path(category, self.url_schema) or canonical_path.startswith(
+                f"/stories/{category}/"
+            ):
+                return category
+        return ""
 
     def _html_page(
         self,
@@ -1083,7 +1361,7 @@ nav.categories a {
         body: str,
         og_type: str = "website",
         og_image: str = "",
-        json_ld_objects: list[dict] | None = None,
+        json_ld_objects: list[dict | str] | None = None,
     ) -> str:
         esc_title = html.escape(title)
         seo_head = self._seo_head(
@@ -1094,48 +1372,70 @@ nav.categories a {
             og_image=og_image,
             json_ld_objects=json_ld_objects,
         )
-        return f"""<!doctype html>
-<html lang=\"en\">
-<head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-  <title>{esc_title}</title>
-  {seo_head}
-  <link rel=\"stylesheet\" href=\"{self._href('/assets/site.css')}\" />
-  <script async src=\"https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client={html.escape(self.adsense_client)}\" crossorigin=\"anonymous\"></script>
-</head>
-<body>
-  <a class=\"skip-link\" href=\"#main-content\">Skip to content</a>
-  {self._render_topbar(canonical_path=canonical_path)}
-  <main id=\"main-content\">
-    {body}
-    <p class=\"footer-note\">{html.escape(PROJECT_TITLE)} · {html.escape(PROJECT_TAGLINE)}</p>
-  </main>
-</body>
-</html>
-"""
+        return (
+            f"{_PAGE_HEAD_OPEN}{esc_title}</title>\n  {seo_head}\n{self._page_head_close}"
+            f"{self._render_topbar(canonical_path=canonical_path)}\n  <main id=\"main-content\">\n    {body}{_PAGE_CLOSE}"
+        )
+
+    def _make_views(self, posts: list[PublishedBrief]) -> list[_PostView]:
+        views: list[_PostView] = []
+        for post in posts:
+            href = self._href(post.path)
+            views.append(
+                _PostView(
+                    post=post,
+                    esc_title=_esc(post.title),
+                    esc_href=_esc(href),
+                    esc_url=_esc(f"{self.site_url}{post.path}"),
+                    esc_meta=_esc(post.meta_description or PROJECT_TAGLINE),
+                    esc_published=_esc(post.published_at),
+                    esc_category=_esc(post.category),
+                    esc_category_label=_esc_category_label(post.category),
+                )
+            )
+        return views
 
-    def _post_card(self, post: PublishedBrief) -> str:
-        category_label = CATEGORY_LABELS.get(post.category, post.category)
-        cover_desc = post.meta_description or PROJECT_TAGLINE
+    def _post_card(self, view: _PostView) -> str:
         return f"""
 <article class=\"story-card\">
-  <a class=\"story-media story-media-text\" data-category=\"{html.escape(post.category)}\" href=\"{html.escape(self._href(post.path))}\">
+  <a class=\"story-media story-media-text\" data-category=\"{view.esc_category}\" href=\"{view.esc_href}\">
     <span class=\"story-media-inner\">
-      <span class=\"cover-chip\">{html.escape(category_label)}</span>
-      <strong class=\"cover-title\">{html.escape(post.title)}</strong>
-      <span class=\"cover-desc\">{html.escape(cover_desc)}</span>
+      <span class=\"cover-chip\">{view.esc_category_label}</span>
+      <strong class=\"cover-title\">{view.esc_title}</strong>
+      <span class=\"cover-desc\">{view.esc_meta}</span>
     </span>
   </a>
   <div class=\"story-body\">
-    <h3 class=\"story-title\"><a href=\"{html.escape(self._href(post.path))}\">{html.escape(post.title)}</a></h3>
-    <p class=\"story-summary\">{html.escape(post.meta_description or PROJECT_TAGLINE)}</p>
-    <p class=\"meta-line\">{html.escape(category_label)} · {html.escape(post.published_at)}</p>
+    <h3 class=\"story-title\"><a href=\"{view.esc_href}\">{view.esc_title}</a></h3>
+    <p class=\"story-summary\">{view.esc_meta}</p>
+    <p class=\"meta-line\">{view.esc_category_label} · {view.esc_published}</p>
   </div>
 </article>
 """
 
-    def _render_post_html(self, brief: GeneratedBrief, published: PublishedBrief, internal_links: list[PublishedBrief]) -> str:
+    def _breadcrumb_json(self, category: str, published: PublishedBrief) -> str:
+        """Serialize the breadcrumb list, reusing the Home/category prefix per category."""
+        prefix = self._breadcrumb_prefixes.get(category)
+        if prefix is None:
+            skeleton = {
+                "@context": "https://schema.org",
+                "@type": "BreadcrumbList",
+                "itemListElement": [
+                    {"@type": "ListItem", "position": 1, "name": "Home", "item": self._public_url('/index.html')},
+                    {
+                        "@type": "ListItem",
+                        "position": 2,
+                        "name": CATEGORY_LABELS.get(category, category),
+                        "item": self._public_url(build_category_path(category, self.url_schema)),
+                    },
+                ],
+            }
+            # Drop the closing "]}" so the per-post item can be appended.
+            prefix = self._breadcrumb_prefixes[category] = dumps_json_compact(skeleton)[:-2]
+        item = {"@type": "ListItem", "position": 3, "name": published.title, "item": self._public_url(published.path)}
+        return f"{prefix},{dumps_json_compact(item)}]}}"
+
+    def _render_post_html(self, brief: GeneratedBrief, published: PublishedBrief, internal_links: list[_PostView]) -> str:
         payload = brief.payload
         category_label = CATEGORY_LABELS.get(brief.topic.category, brief.topic.category)
         thumb = self._thumbnail_relpath(published)
@@ -1160,35 +1460,25 @@ nav.categories a {
             disclaimer = f"<p><em>{html.escape(str(payload['disclaimer']))}</em></p>"
         inline_3 = self._ad_slot("inline-3") if word_count >= 1050 else ""
 
-        article_schema = payload.get("json_ld") if isinstance(payload.get("json_ld"), dict) else {}
-        article_schema = dict(article_schema)
-        article_schema["url"] = self._public_url(published.path)
-        article_schema["mainEntityOfPage"] = self._public_url(published.path)
-        article_schema["image"] = [self._public_url(thumb)]
-        article_schema["headline"] = payload.get("title") or published.title
-        article_schema["description"] = payload.get("meta_description") or published.meta_description
-        article_schema["datePublished"] = published.published_at
-        article_schema["dateModified"] = published.published_at
-        article_schema["articleSection"] = category_label
-
-        breadcrumb_schema = {
-            "@context": "https://schema.org",
-            "@type": "BreadcrumbList",
-            "itemListElement": [
-                {"@type": "ListItem", "position": 1, "name": "Home", "item": self._public_url('/index.html')},
-                {
-                    "@type": "ListItem",
-                    "position": 2,
-                    "name": category_label,
-                    "item": self._public_url(build_category_path(brief.topic.category, self.url_schema)),
-                },
-                {"@type": "ListItem", "position": 3, "name": published.title, "item": self._public_url(published.path)},
-            ],
+        public_url = self._public_url(published.path)
+        page_fields = {
+            "url": public_url,
+            "mainEntityOfPage": public_url,
+            "image": [self._public_url(thumb)],
+            "headline": payload.get("title") or published.title,
+            "description": payload.get("meta_description") or published.meta_description,
+            "datePublished": published.published_at,
+            "dateModified": published.published_at,
+            "articleSection": category_label,
         }
+        schema = payload.get("json_ld") if isinstance(payload.get("json_ld"), dict) else {}
+        article_schema = {**schema, **page_fields}
+
+        breadcrumb_json = self._breadcrumb_json(brief.topic.category, published)
 
         body = f"""
 <header class=\"hero\">
-  <span class=\"header-kicker\">{html.escape(category_label)}</span>
+  <span class=\"header-kicker\">{_esc_category_label(brief.topic.category)}</span>
   <h1>{html.escape(payload.get('title') or published.title)}</h1>
   <p>{html.escape(published.published_at)} · {int(payload.get('reading_time') or max(1, round(published.word_count / 220)))} min read</p>
 </header>
@@ -1228,38 +1518,29 @@ nav.categories a {
             body=body,
             og_type="article",
             og_image=thumb,
-            json_ld_objects=[article_schema, breadcrumb_schema],
+            json_ld_objects=[article_schema, breadcrumb_json],
         )
 
-    def _render_home_html(self, posts: list[PublishedBrief]) -> str:
-        featured = posts[0] if posts else None
-        trending = posts[:5]
-        grid_posts = posts[1:25] if len(posts) > 1 else []
-
-        nav = "".join(
-            [
-                f"<a href=\"{html.escape(self._href(build_category_path(category, self.url_schema)))}\">{html.escape(CATEGORY_LABELS.get(category, category))}</a>"
-                for category in ALL_CATEGORIES
-            ]
-        )
+    def _render_home_html(self, views: list[_PostView]) -> str:
+        featured = views[0] if views else None
+        trending = views[:5]
+        grid_posts = views[1:25] if len(views) > 1 else []
 
         if featured:
-            featured_category = CATEGORY_LABELS.get(featured.category, featured.category)
-            featured_cover_desc = featured.meta_description or PROJECT_TAGLINE
             featured_html = f"""
 <article class=\"featured\">
-  <a class=\"featured-media featured-media-text\" data-category=\"{html.escape(featured.category)}\" href=\"{html.escape(self._href(featured.path))}\">
+  <a class=\"featured-media featured-media-text\" data-category=\"{featured.esc_category}\" href=\"{featured.esc_href}\">
     <span class=\"featured-media-inner\">
-      <span class=\"cover-chip\">{html.escape(featured_category)}</span>
-      <strong class=\"cover-title\">{html.escape(featured.title)}</strong>
-      <span class=\"cover-desc\">{html.escape(featured_cover_desc)}</span>
+      <span class=\"cover-chip\">{featured.esc_category_label}</span>
+      <strong class=\"cover-title\">{featured.esc_title}</strong>
+      <span class=\"cover-desc\">{featured.esc_meta}</span>
     </span>
   </a>
   <div class=\"featured-body\">
     <span class=\"header-kicker\">Featured</span>
-    <h2><a href=\"{html.escape(self._href(featured.path))}\">{html.escape(featured.title)}</a></h2>
-    <p>{html.escape(featured.meta_description or PROJECT_TAGLINE)}</p>
-    <p class=\"meta-line\">{html.escape(featured.published_at)}</p>
+    <h2><a href=\"{featured.esc_href}\">{featured.esc_title}</a></h2>
+    <p>{featured.esc_meta}</p>
+    <p class=\"meta-line\">{featured.esc_published}</p>
   </div>
 </article>
 """
@@ -1268,13 +1549,13 @@ nav.categories a {
 
         trending_html = "".join(
             [
-                f"<li><a href=\"{html.escape(self._href(post.path))}\">{html.escape(post.title)}</a><br /><span class=\"meta-line\">{html.escape(post.published_at)}</span></li>"
-                for post in trending
+                f"<li><a href=\"{view.esc_href}\">{view.esc_title}</a><br /><span class=\"meta-line\">{view.esc_published}</span></li>"
+                for view in trending
             ]
         )
 
-        cards_primary = "".join([self._post_card(post) for post in grid_posts[:12]])
-        cards_secondary = "".join([self._post_card(post) for post in grid_posts[12:24]])
+        cards_primary = "".join([self._post_card(view) for view in grid_posts[:12]])
+        cards_secondary = "".join([self._post_card(view) for view in grid_posts[12:24]])
 
         website_schema = {
             "@context": "https://schema.org",
@@ -1294,10 +1575,10 @@ nav.categories a {
         body = f"""
 <header class=\"hero\">
   <span class=\"header-kicker\">Daily Trend Signals</span>
-  <h1>{html.escape(PROJECT_TITLE)}</h1>
-  <p>{html.escape(PROJECT_TAGLINE)}</p>
+  <h1>{_ESC_PROJECT_TITLE}</h1>
+  <p>{_ESC_PROJECT_TAGLINE}</p>
 </header>
-<nav class=\"categories\">{nav}</nav>
+<nav class=\"categories\">{self._category_nav_html}</nav>
 <div class=\"layout-grid\">
   {featured_html}
   <aside class=\"trending\">
@@ -1324,14 +1605,14 @@ nav.categories a {
             json_ld_objects=[website_schema, org_schema],
         )
 
-    def _render_category_html(self, category: str, posts: list[PublishedBrief]) -> str:
+    def _render_category_html(self, category: str, views: list[_PostView]) -> str:
         category_label = CATEGORY_LABELS.get(category, category)
-        cards = "".join([self._post_card(post) for post in posts[:30]])
-        top = posts[0] if posts else None
+        cards = "".join([self._post_card(view) for view in views[:30]])
+        top = views[0] if views else None
 
         top_html = ""
         if top:
-            top_html = f"<p class=\"meta-line\">Top story: <a href=\"{html.escape(self._href(top.path))}\">{html.escape(top.title)}</a></p>"
+            top_html = f"<p class=\"meta-line\">Top story: <a href=\"{top.esc_href}\">{top.esc_title}</a></p>"
 
         collection_schema = {
             "@context": "https://schema.org",
@@ -1345,7 +1626,7 @@ nav.categories a {
         body = f"""
 <header class=\"hero\">
   <span class=\"header-kicker\">Category</span>
-  <h1>{html.escape(category_label)}</h1>
+  <h1>{_esc_category_label(category)}</h1>
   <p><a href=\"{html.escape(self._href('/index.html'))}\">Back to home</a></p>
   {top_html}
 </header>
@@ -1374,65 +1655,48 @@ nav.categories a {
             ]
         )
 
-    def _render_sitemap(self, posts: list[PublishedBrief]) -> str:
-        rows: list[tuple[str, str]] = [(f"{self.site_url}/index.html", datetime.now().date().isoformat())]
+    def _render_sitemap(self, views: list[_PostView]) -> str:
+        # The document shell shares the one join so the O(N) entries are copied once.
+        lines: list[str] = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+        ]
+        append = lines.append
+        append(_sitemap_entry(_esc(f"{self.site_url}/index.html"), datetime.now().date().isoformat()))
 
         by_category: dict[str, str] = {}
-        for post in posts:
-            post_url = f"{self.site_url}{post.path}"
+        for view in views:
+            post = view.post
             lastmod = str(post.published_at)[:10]
-            rows.append((post_url, lastmod))
-            current = by_category.get(post.category, "")
-            if lastmod > current:
+            append(_sitemap_entry(view.esc_url, lastmod))
+            if lastmod > by_category.get(post.category, ""):
                 by_category[post.category] = lastmod
 
-        for category in ALL_CATEGORIES:
-            rows.append((f"{self.site_url}{build_category_path(category, self.url_schema)}", by_category.get(category, "")))
-
-        entries = "\n".join(
-            [
-                f"  <url><loc>{html.escape(url)}</loc>{f'<lastmod>{html.escape(lastmod)}</lastmod>' if lastmod else ''}</url>"
-                for url, lastmod in rows
-            ]
-        )
-        return f"""<?xml version=\"1.0\" encoding=\"UTF-8\"?>
-<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">
-{entries}
-</urlset>
-"""
+        for category, category_url in self._esc_category_urls:
+            append(_sitemap_entry(category_url, by_category.get(category, "")))
 
-    def _render_rss(self, posts: list[PublishedBrief]) -> str:
-        items: list[str] = []
-        for post in posts[:40]:
-            pub = post.published_at
-            try:
-                dt = datetime.fromisoformat(pub)
-                pub = dt.strftime("%a, %d %b %Y %H:%M:%S %z")
-            except ValueError:
-                pass
+        append("</urlset>\n")
+        return "\n".join(lines)
 
-            items.append(
-                "\n".join(
-                    [
-                        "  <item>",
-                        f"    <title>{html.escape(post.title)}</title>",
-                        f"    <link>{html.escape(self.site_url + post.path)}</link>",
-                        f"    <guid>{html.escape(self.site_url + post.path)}</guid>",
-                        f"    <description>{html.escape(post.meta_description or PROJECT_TAGLINE)}</description>",
-                        f"    <pubDate>{html.escape(pub)}</pubDate>",
-                        "  </item>",
-                    ]
-                )
+    def _render_rss(self, views: list[_PostView]) -> str:
+        parts: list[str] = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<rss version="2.0">',
+            "<channel>",
+            f"  <title>{_ESC_PROJECT_TITLE}</title>",
+            f"  <link>{_esc(self.site_url)}</link>",
+            f"  <description>{_ESC_PROJECT_TAGLINE}</description>",
+        ]
+        append = parts.append
+        for view in views[:40]:
+            append(
+                f"  <item>\n"
+                f"    <title>{view.esc_title}</title>\n"
+                f"    <link>{view.esc_url}</link>\n"
+                f"    <guid>{view.esc_url}</guid>\n"
+                f"    <description>{view.esc_meta}</description>\n"
+                f"    <pubDate>{_esc(_rfc822_date(view.post.published_at))}</pubDate>\n"
+                f"  </item>"
             )
-
-        items_blob = "\n".join(items)
-        return f"""<?xml version=\"1.0\" encoding=\"UTF-8\"?>
-<rss version=\"2.0\">
-<channel>
-  <title>{html.escape(PROJECT_TITLE)}</title>
-  <link>{html.escape(self.site_url)}</link>
-  <description>{html.escape(PROJECT_TAGLINE)}</description>
-{items_blob}
-</channel>
-</rss>
-"""
+        append("</channel>\n</rss>\n")
+        return "\n".join(parts)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import math
+from collections import Counter, deque
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Callable, Iterable
@@ -21,36 +23,121 @@ class ApprovalStats:
     blocked_count: int
 
 
-def _trigram_vector(text: str, dim: int = 256) -> dict[int, float]:
-    norm = normalize_text(text)
-    padded = f"  {norm}  "
-    vec: dict[int, float] = {}
-    for idx in range(len(padded) - 2):
-        tri = padded[idx : idx + 3]
-        bucket = hash(tri) % dim
-        vec[bucket] = vec.get(bucket, 0.0) + 1.0
-    return vec
+# Only the most recent history titles are compared for near-duplicates.
+_HISTORY_WINDOW = 220
 
 
-def _cosine_similarity(a: dict[int, float], b: dict[int, float]) -> float:
-    if not a or not b:
-        return 0.0
-    common = set(a).intersection(b)
-    dot = sum(a[i] * b[i] for i in common)
-    na = math.sqrt(sum(v * v for v in a.values()))
-    nb = math.sqrt(sum(v * v for v in b.values()))
-    if na == 0.0 or nb == 0.0:
-        return 0.0
-    return dot / (na * nb)
-
-
-def _is_near_duplicate(title: str, other_title: str) -> bool:
-    ratio = SequenceMatcher(a=normalize_text(title), b=normalize_text(other_title)).ratio()
-    if ratio >= 0.9:
-        return True
-
-    emb_sim = _cosine_similarity(_trigram_vector(title), _trigram_vector(other_title))
-    return emb_sim >= 0.86
+@dataclass
+class _HistoryTitle:
+    """A history title prepared once per approval run: SequenceMatcher caches its analysis of seq2."""
+
+    id: int
+    norm: str
+    matcher: SequenceMatcher
+    vector: dict[int, int]
+    magnitude: float
+
+
+# Shared across calls (each vertical scans the same history), so callers must not mutate the result.
+@functools.lru_cache(maxsize=4096)
+def _trigram_vector(norm: str, dim: int = 256) -> dict[int, int]:
+    # normalize_text output is ASCII. Folding each byte trigram, rather than hash() of a slice,
+    # keeps buckets stable across runs regardless of PYTHONHASHSEED. dim must be a power of two.
+    data = f"  {norm}  ".encode()
+    mask = dim - 1
+    # Counter tallies in C; integer counts keep every dot product and magnitude exact.
+    return Counter([((a * 31 + b) * 31 + c) & mask for a, b, c in zip(data, data[1:], data[2:])])
+
+
+def _magnitude(vec: dict[int, int]) -> float:
+    return math.sqrt(sum(v * v for v in vec.values()))
+
+
+class _HistoryWindow:
+    """The most recent history titles plus a trigram-bucket index for scoring a title against all of them."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.entries: deque[_HistoryTitle] = deque()
+        self._norms: Counter[str] = Counter()
+        self._postings: dict[int, dict[int, int]] = {}
+        self._magnitudes: dict[int, float] = {}
+        self._by_length: dict[int, dict[int, _HistoryTitle]] = {}
+        self._next_id = 0
+
+    def add(self, norm: str, vector: dict[int, int] | None = None) -> None:
+        if vector is None:
+            vector = _trigram_vector(norm)
+        entry = _HistoryTitle(
+            id=self._next_id,
+            norm=norm,
+            matcher=SequenceMatcher(b=norm),
+            vector=vector,
+            magnitude=_magnitude(vector),
+        )
+        self._next_id += 1
+        self.entries.append(entry)
+        self._norms[norm] += 1
+        self._magnitudes[entry.id] = entry.magnitude
+        self._by_length.setdefault(len(norm), {})[entry.id] = entry
+        for bucket, count in vector.items():
+            self._postings.setdefault(bucket, {})[entry.id] = count
+        if len(self.entries) > self.size:
+            self._evict(self.entries.popleft())
+
+    def _evict(self, entry: _HistoryTitle) -> None:
+        self._norms[entry.norm] -= 1
+        if not self._norms[entry.norm]:
+            del self._norms[entry.norm]
+        del self._magnitudes[entry.id]
+        same_length = self._by_length[len(entry.norm)]
+        del same_length[entry.id]
+        if not same_length:
+            del self._by_length[len(entry.norm)]
+        for bucket in entry.vector:
+            postings = self._postings[bucket]
+            del postings[entry.id]
+            if not postings:
+                del self._postings[bucket]
+
+    def has_near_duplicate(self, norm: str, vector: dict[int, int], magnitude: float) -> bool:
+        # Any one test marks a duplicate, so the cheapest run first: an identical normalized
+        # title has ratio 1.0, then the batched cosine, then SequenceMatcher.
+        if norm in self._norms or self._has_similar_vector(vector, magnitude):
+            return True
+        # real_quick_ratio() >= 0.9 needs the shorter title to be at least 9/11 of the longer, so
+        # only entries in that length band can match; the range is floored and padded to stay inclusive.
+        size = len(norm)
+        by_length = self._by_length
+        for length in range(size * 9 // 11, size * 11 // 9 + 2):
+            same_length = by_length.get(length)
+            if not same_length:
+                continue
+            for entry in same_length.values():
+                matcher = entry.matcher
+                matcher.set_seq1(norm)
+                # real_quick_ratio (lengths) and quick_ratio (character multisets) bound ratio() from
+                # above, so titles they rule out never reach the quadratic matcher.
+                if matcher.real_quick_ratio() >= 0.9 and matcher.quick_ratio() >= 0.9 and matcher.ratio() >= 0.9:
+                    return True
+        return False
+
+    def _has_similar_vector(self, vector: dict[int, int], magnitude: float) -> bool:
+        if magnitude == 0.0:
+            return False
+        # Dot products against every entry at once; entries sharing no bucket have cosine 0.
+        dots: dict[int, int] = {}
+        for bucket, count in vector.items():
+            postings = self._postings.get(bucket)
+            if postings:
+                for entry_id, other in postings.items():
+                    dots[entry_id] = dots.get(entry_id, 0) + count * other
+        magnitudes = self._magnitudes
+        for entry_id, dot in dots.items():
+            other = magnitudes[entry_id]
+            if other and dot / (magnitude * other) >= 0.86:
+                return True
+        return False
 
 
 def _confidence_score(topic: TopicCandidate, policy: PolicyResult) -> float:
@@ -68,6 +155,9 @@ def approve_topics(
 ) -> tuple[list[ApprovedTopic], ApprovalStats]:
     """Filter candidates into approved topics with quality/safety controls."""
     history_titles = [str(row.get("title") or "") for row in history_rows if row.get("title")]
+    recent_history = _HistoryWindow(_HISTORY_WINDOW)
+    for title in history_titles[-_HISTORY_WINDOW:]:
+        recent_history.add(normalize_text(title))
     history_hashes = {str(row.get("dedupe_hash") or "") for row in history_rows if row.get("dedupe_hash")}
 
     candidate_list = list(candidates)
@@ -84,10 +174,9 @@ def approve_topics(
         if d_hash in history_hashes:
             duplicate_hit = True
         else:
-            for old_title in history_titles[-220:]:
-                if _is_near_duplicate(candidate.title, old_title):
-                    duplicate_hit = True
-                    break
+            norm = normalize_text(candidate.title)
+            vector = _trigram_vector(norm)
+            duplicate_hit = recent_history.has_near_duplicate(norm, vector, _magnitude(vector))
 
         if duplicate_hit:
             duplicate_count += 1
@@ -118,7 +207,8 @@ def approve_topics(
                 source_meta=candidate.source_meta,
             )
         )
-        history_titles.append(candidate.title)
+        # Approved candidates always went through the near-duplicate scan, so norm/vector are set.
+        recent_history.add(norm, vector)
         history_hashes.add(d_hash)
 
         if len(approved) >= max_count:
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from .constants import (
     ALL_VERTICALS,
     DEFAULT_PUBLISH_LIMIT,
     MAX_DAILY_HISTORY,
     MAX_PUBLISHED_HISTORY,
+    METRICS_WINDOW_STALE_RUN,
     PUBLISH_STAGES,
     SCALE_RULES,
     TARGET_TIMEZONE,
 )
-from .utils import append_jsonl, read_json, read_jsonl, write_json
+from .utils import append_jsonl, iter_jsonl_reversed, read_json, write_json
 
 
 def default_state(now_iso: str) -> dict:
@@ -60,8 +61,33 @@ def append_metrics(path: str, metrics: dict) -> None:
     append_jsonl(path, metrics)
 
 
-def load_metrics(path: str) -> list[dict]:
-    return read_jsonl(path)
+def load_metrics_window(path: str, window_hours: int, now: datetime) -> list[dict]:
+    """Return metrics rows within the window, reading back from the end of the log.
+
+    Rows are appended in roughly run order, but clock skew, backfills and manual runs can
+    interleave older timestamps, so the scan only stops after a long run of stale rows.
+    """
+    cutoff = now - timedelta(hours=window_hours)
+    parse = datetime.fromisoformat
+    out: list[dict] = []
+    stale_run = 0
+    for row in iter_jsonl_reversed(path):
+        ts = row.get("timestamp")
+        if not ts:
+            continue
+        try:
+            dt = parse(str(ts))
+        except ValueError:
+            continue
+        if dt < cutoff:
+            stale_run += 1
+            if stale_run >= METRICS_WINDOW_STALE_RUN:
+                break
+            continue
+        stale_run = 0
+        out.append(row)
+    out.reverse()
+    return out
 
 
 def upsert_daily_history(state: dict, entry: dict) -> None:
@@ -94,13 +120,15 @@ def maybe_scale_publish_limit(state: dict) -> int | None:
     if len(history) < days:
         return None
 
-    window = history[-days:]
-    for row in window:
-        if float(row.get("duplicate_rate", 1.0)) >= float(SCALE_RULES["duplicate_rate_max"]):
+    duplicate_rate_max = float(SCALE_RULES["duplicate_rate_max"])
+    policy_flag_rate_max = float(SCALE_RULES["policy_flag_rate_max"])
+    indexed_rate_min = float(SCALE_RULES["indexed_rate_min"])
+    for row in history[-days:]:
+        if float(row.get("duplicate_rate", 1.0)) >= duplicate_rate_max:
             return None
-        if float(row.get("policy_flag_rate", 1.0)) >= float(SCALE_RULES["policy_flag_rate_max"]):
+        if float(row.get("policy_flag_rate", 1.0)) >= policy_flag_rate_max:
             return None
-        if float(row.get("indexed_rate", 0.0)) < float(SCALE_RULES["indexed_rate_min"]):
+        if float(row.get("indexed_rate", 0.0)) < indexed_rate_min:
             return None
 
     next_stage = current
@@ -114,20 +142,3 @@ def maybe_scale_publish_limit(state: dict) -> int | None:
         return next_stage
 
     return None
-
-
-def filter_metrics_by_window(rows: list[dict], window_hours: int, now: datetime) -> list[dict]:
-    out: list[dict] = []
-    for row in rows:
-        ts = row.get("timestamp")
-        if not ts:
-            continue
-        try:
-            dt = datetime.fromisoformat(str(ts))
-        except ValueError:
-            continue
-
-        delta_hours = (now - dt).total_seconds() / 3600.0
-        if delta_hours <= float(window_hours):
-            out.append(row)
-    return out
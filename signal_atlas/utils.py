@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import mmap
 import re
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,6 +13,39 @@ from zoneinfo import ZoneInfo
 
 from .constants import TARGET_TIMEZONE
 
+try:  # pragma: no cover - optional dependency.
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency.
+    orjson = None
+
+# Both parsers accept UTF-8 bytes. Bad input raises ValueError subclasses: JSONDecodeError,
+# or UnicodeDecodeError from the stdlib parser on invalid UTF-8.
+_loads_json_bytes = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_json_indented(payload: dict | list) -> bytes:
+    """Serialize like json.dumps(ensure_ascii=False, indent=2), natively when orjson is available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them.
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# json.dumps builds a new encoder per call whenever options are passed.
+_encode_json_compact_stdlib = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def dumps_json_compact(obj: dict | list) -> str:
+    """Compact, non-ASCII-preserving JSON; orjson emits the same text for plain strings and lists."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass  # e.g. lone surrogates or integers beyond 64 bits.
+    return _encode_json_compact_stdlib(obj)
+
 
 def now_tz() -> datetime:
     return datetime.now(ZoneInfo(TARGET_TIMEZONE))
@@ -44,8 +79,7 @@ def write_json(path: str | Path, payload: dict | list) -> None:
     p = Path(path)
     ensure_dir(p.parent)
     tmp = p.with_suffix(p.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    tmp.write_bytes(_dumps_json_indented(payload))
     tmp.replace(p)
 
 
@@ -56,21 +90,24 @@ def append_jsonl(path: str | Path, payload: dict) -> None:
         f.write(json.dumps(payload, ensure_ascii=False) + "\n")
 
 
-def read_jsonl(path: str | Path) -> list[dict]:
+def iter_jsonl_reversed(path: str | Path):
+    """Yield JSONL rows newest-first, scanning a memory map back from EOF."""
     p = Path(path)
-    if not p.exists():
-        return []
-    rows: list[dict] = []
-    with p.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+    if not p.exists() or p.stat().st_size == 0:
+        return
+    loads = _loads_json_bytes
+    with p.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm)
+        while end > 0:
+            start = mm.rfind(b"\n", 0, end) + 1
+            line = mm[start:end]
+            end = start - 1
+            if not line or line.isspace():
                 continue
             try:
-                rows.append(json.loads(line))
-            except json.JSONDecodeError:
+                yield loads(line)
+            except ValueError:
                 continue
-    return rows
 
 
 _slug_re = re.compile(r"[^a-z0-9]+")
@@ -83,8 +120,13 @@ def slugify(text: str, max_len: int = 80) -> str:
     return out[:max_len].strip("-")
 
 
+_norm_token_re = re.compile(r"[a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_text(text: str) -> str:
-    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9\s]", " ", text.lower())).strip()
+    # Every non [a-z0-9] run is a separator, so one tokenizing pass replaces substitute-then-collapse.
+    return " ".join(_norm_token_re.findall(text.lower()))
 
 
 def stable_hash(text: str, n: int = 16) -> str:
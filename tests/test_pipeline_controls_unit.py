@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import tempfile
+import threading
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -82,6 +83,82 @@ class PipelineControlsUnitTests(unittest.TestCase):
             self.assertGreater(out["budget"]["spent_krw"], 0)
             self.assertLessEqual(out["budget"]["spent_krw"], 300)
 
+    def _run_with_costs(self, budget_krw: str, on_generate=None) -> tuple[dict, list[str]]:
+        seen: list[str] = []
+        lock = threading.Lock()
+
+        def fake_build_generated_brief(topic, **kwargs):
+            engine = kwargs.get("generation_engine", "gemini")
+            quality = kwargs.get("quality_tier", "premium")
+            if on_generate is not None:
+                on_generate()
+            with lock:
+                seen.append(f"{engine}:{quality}")
+            # Actual costs run above PREMIUM_EST_KRW (220) and BALANCED_EST_KRW (120).
+            cost = (300.0 if quality == "premium" else 150.0) if engine == "gemini" else 0.0
+            payload = {"generation_engine": engine, "generation_cost_krw": cost, "source_urls": topic.source_urls}
+            return GeneratedBrief(topic=topic, slug=f"{topic.id}-brief", markdown="# Brief", payload=payload, word_count=900)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            pipe = Pipeline(
+                state_file=str(base / "state" / "pipeline_state.json"),
+                metrics_file=str(base / "state" / "ops_metrics.jsonl"),
+                artifacts_dir=str(base / "artifacts"),
+                site_dir=str(base / "site"),
+                ingestor=_MiniIngestor(),
+            )
+            with patch.dict("os.environ", {"MONTHLY_BUDGET_KRW": budget_krw}, clear=False):
+                with patch("signal_atlas.pipeline.build_generated_brief", side_effect=fake_build_generated_brief):
+                    out = pipe.run(vertical="ai_tech", max_publish=3, mode="dry-run", generation_engine="gemini", quality_tier="premium")
+        return out, seen
+
+    def test_costs_above_estimate_near_limit_are_reconciled_before_each_choice(self) -> None:
+        out, seen = self._run_with_costs("700")
+
+        # Same choices as one-at-a-time generation: 300 + 300 spent leaves 100, below any estimate.
+        self.assertEqual(seen, ["gemini:premium", "gemini:premium", "template:balanced"])
+        self.assertEqual(out["budget"]["spent_krw"], 600)
+
+    def test_generation_runs_concurrently_and_refunds_reservations(self) -> None:
+        barrier = threading.Barrier(3, timeout=10)
+        out, seen = self._run_with_costs("100000", on_generate=barrier.wait)
+
+        self.assertEqual(seen, ["gemini:premium"] * 3)
+        self.assertEqual(out["budget"]["spent_krw"], 900)
+
+    def test_migrate_published_category_handles_malformed_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            pipe = Pipeline(
+                state_file=str(base / "state" / "pipeline_state.json"),
+                metrics_file=str(base / "state" / "ops_metrics.jsonl"),
+                artifacts_dir=str(base / "artifacts"),
+                site_dir=str(base / "site"),
+                ingestor=_MiniIngestor(),
+            )
+            current = {
+                "slug": "current",
+                "vertical": "ai_tech",
+                "category": "ai",
+                "path": "/stories/ai/current.html",
+                "legacy_paths": [],
+                "url_schema": "v2",
+                "template_version": "magazine-v2",
+            }
+            malformed = {"slug": "odd", "vertical": "ai_tech", "category": ["ai"], "path": "/stories/ai/odd.html"}
+            state = {"published": [current, malformed, "not-a-row"]}
+
+            pipe._migrate_published_category(state)
+
+            rows = state["published"]
+            self.assertEqual([row["slug"] for row in rows], ["current", "odd"])
+            self.assertEqual(rows[0], current)
+            self.assertIsNot(rows[0], current)
+            self.assertIsNot(rows[0]["legacy_paths"], current["legacy_paths"])
+            self.assertEqual(rows[1]["category"], "ai")
+            self.assertEqual(rows[1]["path"], "/stories/ai/odd.html")
+
 
 if __name__ == "__main__":
     unittest.main()
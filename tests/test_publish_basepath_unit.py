@@ -66,6 +66,10 @@ class PublishBasePathUnitTests(unittest.TestCase):
             article_html = (site_dir / "stories" / "ai" / "signal-atlas-test-headline.html").read_text(encoding="utf-8")
             self.assertIn('class="article-cover featured-media featured-media-text" data-category="ai"', article_html)
             self.assertNotIn('class="hero-image"', article_html)
+            self.assertIn(
+                '"url":"https://foo.github.io/signal-atlas/stories/ai/signal-atlas-test-headline.html"',
+                article_html,
+            )
             self.assertIn('aria-current="page">AI</a>', article_html)
             self.assertIn('property="og:site_name" content="Signal Atlas"', article_html)
             self.assertIn('type="application/rss+xml"', article_html)
@@ -134,6 +138,98 @@ class PublishBasePathUnitTests(unittest.TestCase):
             self.assertIn('http-equiv="refresh"', legacy_redirect)
             self.assertIn('/signal-atlas/stories/ai/legacy-post.html', legacy_redirect)
 
+    def test_localized_image_is_hardlinked_into_new_site(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            site_dir = Path(tmp) / "site"
+            image_path = site_dir / "assets" / "images" / "kept-post.jpg"
+            image_path.parent.mkdir(parents=True, exist_ok=True)
+            image_path.write_bytes(b"jpeg-bytes")
+            inode = image_path.stat().st_ino
+
+            publisher = StaticSitePublisher(site_dir=str(site_dir), site_url="https://foo.github.io/signal-atlas")
+            publisher.publish(
+                generated_briefs=[],
+                existing_rows=[
+                    {
+                        "slug": "kept-post",
+                        "vertical": "ai_tech",
+                        "title": "Kept Post",
+                        "published_at": "2026-02-19T12:00:00+09:00",
+                        "path": "/stories/ai/kept-post.html",
+                        "category": "ai",
+                        "primary_image": "/assets/images/kept-post.jpg",
+                    }
+                ],
+                now_iso="2026-02-19T12:00:00+09:00",
+            )
+
+            self.assertEqual(image_path.read_bytes(), b"jpeg-bytes")
+            self.assertEqual(image_path.stat().st_ino, inode)
+
+    def test_rewriting_a_cloned_file_leaves_the_live_copy_untouched(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            site_dir = Path(tmp) / "site"
+            live_path = site_dir / "assets" / "images" / "kept-post.jpg"
+            live_path.parent.mkdir(parents=True, exist_ok=True)
+            live_path.write_bytes(b"live-bytes")
+            staging = Path(tmp) / "staging"
+
+            publisher = StaticSitePublisher(site_dir=str(site_dir))
+            self.assertTrue(publisher._link_from_live_site("assets/images/kept-post.jpg", staging))
+            staged_path = staging / "assets" / "images" / "kept-post.jpg"
+            publisher._flush_writes({staged_path: b"new-bytes"}, staging)
+
+            self.assertEqual(staged_path.read_bytes(), b"new-bytes")
+            self.assertEqual(live_path.read_bytes(), b"live-bytes")
+
+    def test_unchanged_files_are_linked_instead_of_rewritten(self) -> None:
+        rows = [
+            {
+                "slug": "kept-post",
+                "vertical": "ai_tech",
+                "title": "Kept Post",
+                "published_at": "2026-02-19T12:00:00+09:00",
+                "path": "/stories/ai/kept-post.html",
+                "category": "ai",
+            }
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            site_dir = Path(tmp) / "site"
+            publisher = StaticSitePublisher(site_dir=str(site_dir), site_url="https://foo.github.io/signal-atlas")
+            publisher.publish(generated_briefs=[], existing_rows=rows, now_iso="2026-02-19T12:00:00+09:00")
+            story_path = site_dir / "stories" / "ai" / "kept-post.html"
+            inode = story_path.stat().st_ino
+
+            StaticSitePublisher(site_dir=str(site_dir), site_url="https://foo.github.io/signal-atlas").publish(
+                generated_briefs=[], existing_rows=rows, now_iso="2026-02-19T12:00:00+09:00"
+            )
+
+            self.assertEqual(story_path.stat().st_ino, inode)
+
+    def test_publish_leaves_unrelated_old_siblings_alone(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            site_dir = Path(tmp) / "site"
+            keep = [Path(tmp) / "site.notes.old.keep", Path(tmp) / "site.backup.old.draft"]
+            for path in keep:
+                path.mkdir()
+
+            StaticSitePublisher(site_dir=str(site_dir)).publish(
+                generated_briefs=[], existing_rows=[], now_iso="2026-02-19T12:00:00+09:00"
+            )
+
+            for path in keep:
+                self.assertTrue(path.is_dir(), path.name)
+
+    def test_repeated_publishes_leave_no_old_trees_after_joining(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            site_dir = Path(tmp) / "site"
+            publisher = StaticSitePublisher(site_dir=str(site_dir))
+            for _ in range(2):
+                publisher.publish(generated_briefs=[], existing_rows=[], now_iso="2026-02-19T12:00:00+09:00")
+            publisher._join_discards()
+
+            self.assertEqual(sorted(path.name for path in Path(tmp).iterdir()), ["site"])
+
     def test_inline_3_slot_appears_for_long_article(self) -> None:
         topic = ApprovedTopic(
             id="a2",
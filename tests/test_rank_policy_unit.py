@@ -31,6 +31,29 @@ class RankPolicyUnitTests(unittest.TestCase):
         self.assertEqual(len(approved), 0)
         self.assertEqual(stats.duplicate_count, 1)
 
+    def test_duplicate_detection_covers_titles_approved_in_same_batch(self) -> None:
+        candidates = [
+            TopicCandidate(
+                id=f"c{idx}",
+                vertical="ai_tech",
+                title=title,
+                source_urls=["https://example.com/a"],
+                discovered_at="2026-02-19T00:00:00+09:00",
+                snippet="Developers are adopting copilots faster than expected.",
+            )
+            for idx, title in enumerate(
+                [
+                    "AI copilots are reshaping developer workflow this quarter",
+                    "AI copilots reshaping developer workflows this quarter",
+                    "Chipmakers expand inference capacity in Asia",
+                ]
+            )
+        ]
+
+        approved, stats = approve_topics(candidates, history_rows=[], max_count=3)
+        self.assertEqual([one.id for one in approved], ["c0", "c2"])
+        self.assertEqual(stats.duplicate_count, 1)
+
     def test_finance_policy_blocks_investment_advice(self) -> None:
         topic = TopicCandidate(
             id="c2",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import subprocess
 import sys
@@ -7,67 +9,84 @@ import tempfile
 import unittest
 from pathlib import Path
 
+import render_site_from_state
+
+
+_STATE = {
+    "version": 1,
+    "timezone": "Asia/Seoul",
+    "created_at": "2026-02-20T00:00:00+09:00",
+    "updated_at": "2026-02-20T00:00:00+09:00",
+    "publish_limit": 12,
+    "disabled_verticals": [],
+    "vertical_deploy_failures": {"ai_tech": 0, "finance": 0, "lifestyle_pop": 0},
+    "published": [
+        {
+            "slug": "legacy-render",
+            "vertical": "ai_tech",
+            "title": "Legacy Render",
+            "published_at": "2026-02-20T00:00:00+09:00",
+            "word_count": 930,
+            "source_urls": ["https://example.com/a"],
+            "ad_slots": ["top-banner"],
+            "dedupe_hash": "legacy-render",
+            "path": "/category/ai/legacy-render.html",
+            "category": "ai",
+            "meta_description": "Legacy render description",
+        }
+    ],
+    "daily_history": [],
+}
+
 
 class RenderFromStateIntegrationTests(unittest.TestCase):
+    def _write_state(self, work: Path) -> Path:
+        state_dir = work / "state"
+        state_dir.mkdir(parents=True, exist_ok=True)
+        state_file = state_dir / "pipeline_state.json"
+        state_file.write_text(json.dumps(_STATE, ensure_ascii=False), encoding="utf-8")
+        return state_file
+
+    def _args(self, state_file: Path, site_dir: Path) -> list[str]:
+        return [
+            "--state-file",
+            str(state_file),
+            "--site-dir",
+            str(site_dir),
+            "--site-url",
+            "https://foo.github.io/signal-atlas",
+            "--url-schema",
+            "v2",
+        ]
+
     def test_render_from_state_generates_story_topic_and_redirects(self) -> None:
-        repo_root = Path(__file__).resolve().parents[1]
         with tempfile.TemporaryDirectory() as tmp:
             work = Path(tmp)
-            state_dir = work / "state"
+            state_file = self._write_state(work)
             site_dir = work / "site"
-            state_dir.mkdir(parents=True, exist_ok=True)
-            state_file = state_dir / "pipeline_state.json"
-            state_file.write_text(
-                json.dumps(
-                    {
-                        "version": 1,
-                        "timezone": "Asia/Seoul",
-                        "created_at": "2026-02-20T00:00:00+09:00",
-                        "updated_at": "2026-02-20T00:00:00+09:00",
-                        "publish_limit": 12,
-                        "disabled_verticals": [],
-                        "vertical_deploy_failures": {"ai_tech": 0, "finance": 0, "lifestyle_pop": 0},
-                        "published": [
-                            {
-                                "slug": "legacy-render",
-                                "vertical": "ai_tech",
-                                "title": "Legacy Render",
-                                "published_at": "2026-02-20T00:00:00+09:00",
-                                "word_count": 930,
-                                "source_urls": ["https://example.com/a"],
-                                "ad_slots": ["top-banner"],
-                                "dedupe_hash": "legacy-render",
-                                "path": "/category/ai/legacy-render.html",
-                                "category": "ai",
-                                "meta_description": "Legacy render description",
-                            }
-                        ],
-                        "daily_history": [],
-                    },
-                    ensure_ascii=False,
-                ),
-                encoding="utf-8",
-            )
 
-            cmd = [
-                sys.executable,
-                str(repo_root / "render_site_from_state.py"),
-                "--state-file",
-                str(state_file),
-                "--site-dir",
-                str(site_dir),
-                "--site-url",
-                "https://foo.github.io/signal-atlas",
-                "--url-schema",
-                "v2",
-            ]
-            subprocess.run(cmd, cwd=repo_root, check=True, capture_output=True, text=True)
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(render_site_from_state.main(self._args(state_file, site_dir)), 0)
 
+            self.assertEqual(json.loads(out.getvalue())["rendered_posts"], 1)
             self.assertTrue((site_dir / "stories" / "ai" / "legacy-render.html").exists())
             self.assertTrue((site_dir / "topics" / "ai" / "index.html").exists())
             legacy_redirect = (site_dir / "category" / "ai" / "legacy-render.html").read_text(encoding="utf-8")
             self.assertIn("refresh", legacy_redirect)
 
+    def test_render_from_state_cli_smoke(self) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        with tempfile.TemporaryDirectory() as tmp:
+            work = Path(tmp)
+            state_file = self._write_state(work)
+            site_dir = work / "site"
+
+            cmd = [sys.executable, str(repo_root / "render_site_from_state.py"), *self._args(state_file, site_dir)]
+            result = subprocess.run(cmd, cwd=repo_root, check=True, capture_output=True, text=True)
+
+            self.assertEqual(json.loads(result.stdout)["rendered_posts"], 1)
+            self.assertTrue((site_dir / "stories" / "ai" / "legacy-render.html").exists())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import json
+import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
 
-from signal_atlas.state import maybe_scale_publish_limit
+from signal_atlas.state import load_metrics_window, maybe_scale_publish_limit
 
 
 class ThrottleUnitTests(unittest.TestCase):
@@ -46,6 +51,47 @@ class ThrottleUnitTests(unittest.TestCase):
         self.assertIsNone(scaled_to)
         self.assertEqual(state["publish_limit"], 12)
 
+    def test_metrics_window_reads_recent_rows_in_order(self) -> None:
+        now = datetime(2026, 2, 8, 12, 0, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ops_metrics.jsonl"
+            lines = [
+                f'{{"timestamp": "{(now - timedelta(hours=hours)).isoformat()}", "publish_count": {hours}}}'
+                for hours in (30, 20, 5, 1)
+            ]
+            lines.insert(3, "not json")
+            path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+
+            rows = load_metrics_window(str(path), window_hours=24, now=now)
+            self.assertEqual([row["publish_count"] for row in rows], [20, 5, 1])
+            self.assertEqual(load_metrics_window(str(Path(tmp) / "missing.jsonl"), window_hours=24, now=now), [])
+
+    def test_metrics_window_keeps_rows_written_out_of_order(self) -> None:
+        now = datetime(2026, 2, 8, 12, 0, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ops_metrics.jsonl"
+            path.write_text(
+                "".join(
+                    f'{{"timestamp": "{(now - timedelta(hours=hours)).isoformat()}", "publish_count": {hours}}}\n'
+                    for hours in (5, 30, 1)
+                ),
+                encoding="utf-8",
+            )
+
+            rows = load_metrics_window(str(path), window_hours=24, now=now)
+            self.assertEqual([row["publish_count"] for row in rows], [5, 1])
+
+    def test_metrics_window_skips_invalid_utf8_with_stdlib_parser(self) -> None:
+        now = datetime(2026, 2, 8, 12, 0, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ops_metrics.jsonl"
+            row = f'{{"timestamp": "{(now - timedelta(hours=1)).isoformat()}", "publish_count": 1}}\n'
+            path.write_bytes(row.encode("utf-8") + b'{"timestamp": "\xff"}\n')
+
+            with patch("signal_atlas.utils._loads_json_bytes", json.loads):
+                rows = load_metrics_window(str(path), window_hours=24, now=now)
+            self.assertEqual([row["publish_count"] for row in rows], [1])
+
 
 if __name__ == "__main__":
     unittest.main()
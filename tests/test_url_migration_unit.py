@@ -2,85 +2,108 @@ from __future__ import annotations
 
 import tempfile
 import unittest
+from dataclasses import replace
 from pathlib import Path
 
+from signal_atlas.constants import STORY_PATH_PATTERN_V2
 from signal_atlas.content import build_generated_brief
 from signal_atlas.models import ApprovedTopic, SourceMeta
+from signal_atlas.pipeline import _story_path
 from signal_atlas.publish import StaticSitePublisher, build_category_path, build_story_path
 
+_BASE_TOPIC = ApprovedTopic(
+    id="x",
+    vertical="ai_tech",
+    category="ai",
+    title="Same Headline",
+    source_urls=[],
+    discovered_at="2026-02-20T00:00:00+09:00",
+    confidence_score=0.9,
+    policy_score=0.95,
+    dedupe_hash="",
+)
+
+# publish() only reads existing rows, so the fixture can be shared as-is.
+_LEGACY_ROW = {
+    "slug": "legacy",
+    "vertical": "ai_tech",
+    "title": "Legacy",
+    "published_at": "2026-02-20T00:00:00+09:00",
+    "word_count": 900,
+    "source_urls": ["https://example.com/a"],
+    "ad_slots": ["top-banner"],
+    "dedupe_hash": "legacy",
+    "path": "/category/ai/legacy.html",
+    "category": "ai",
+    "meta_description": "Legacy description",
+}
+
 
 class UrlMigrationUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls._root = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
+    def _site_dir(self) -> Path:
+        return self._root / self._testMethodName / "site"
+
+    @staticmethod
+    def _html_files(site_dir: Path) -> set[str]:
+        return {path.relative_to(site_dir).as_posix() for path in site_dir.rglob("*.html")}
+
+    def _make_publisher(self, site_dir: Path) -> StaticSitePublisher:
+        return StaticSitePublisher(site_dir=str(site_dir), site_url="https://foo.github.io/signal-atlas")
+
     def test_v2_path_builders(self) -> None:
         self.assertEqual(build_category_path("ai", "v2"), "/topics/ai/index.html")
         self.assertEqual(build_story_path("ai", "hello-world", "v2"), "/stories/ai/hello-world.html")
 
+    def test_pipeline_story_path_matches_v2_pattern(self) -> None:
+        for category, slug in (("ai", "hello-world"), ("stocks", "q3-earnings-2")):
+            self.assertEqual(_story_path(category, slug), STORY_PATH_PATTERN_V2.format(category=category, slug=slug))
+
     def test_slug_collision_adds_suffix(self) -> None:
-        topic1 = ApprovedTopic(
-            id="x1",
-            vertical="ai_tech",
-            category="ai",
-            title="Same Headline",
-            source_urls=["https://example.com/1"],
-            discovered_at="2026-02-20T00:00:00+09:00",
-            confidence_score=0.9,
-            policy_score=0.95,
-            dedupe_hash="d1",
-            source_meta=[SourceMeta(url="https://example.com/1")],
-        )
-        topic2 = ApprovedTopic(
-            id="x2",
-            vertical="ai_tech",
-            category="ai",
-            title="Same Headline",
-            source_urls=["https://example.com/2"],
-            discovered_at="2026-02-20T00:00:00+09:00",
-            confidence_score=0.9,
-            policy_score=0.95,
-            dedupe_hash="d2",
-            source_meta=[SourceMeta(url="https://example.com/2")],
-        )
-        brief1 = build_generated_brief(topic1)
-        brief2 = build_generated_brief(topic2)
+        topics = [
+            replace(
+                _BASE_TOPIC,
+                id=f"x{idx}",
+                source_urls=[f"https://example.com/{idx}"],
+                dedupe_hash=f"d{idx}",
+                source_meta=[SourceMeta(url=f"https://example.com/{idx}")],
+            )
+            for idx in range(1, 4)
+        ]
+        briefs = [build_generated_brief(topic) for topic in topics]
 
-        with tempfile.TemporaryDirectory() as tmp:
-            site_dir = Path(tmp) / "site"
-            publisher = StaticSitePublisher(site_dir=str(site_dir), site_url="https://foo.github.io/signal-atlas")
-            published = publisher.publish([brief1, brief2], existing_rows=[], now_iso="2026-02-20T10:00:00+09:00")
+        site_dir = self._site_dir()
+        publisher = self._make_publisher(site_dir)
+        published = publisher.publish(briefs, existing_rows=[], now_iso="2026-02-20T10:00:00+09:00")
 
-            slugs = sorted([one.slug for one in published])
-            self.assertEqual(slugs, ["same-headline", "same-headline-2"])
-            self.assertTrue((site_dir / "stories" / "ai" / "same-headline.html").exists())
-            self.assertTrue((site_dir / "stories" / "ai" / "same-headline-2.html").exists())
+        expected = ["same-headline"] + [f"same-headline-{idx}" for idx in range(2, len(topics) + 1)]
+        self.assertCountEqual([one.slug for one in published], expected)
+        files = self._html_files(site_dir)
+        for slug in expected:
+            with self.subTest(slug=slug):
+                self.assertIn(f"stories/ai/{slug}.html", files)
 
     def test_legacy_category_path_is_redirected(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            site_dir = Path(tmp) / "site"
-            publisher = StaticSitePublisher(site_dir=str(site_dir), site_url="https://foo.github.io/signal-atlas")
-            publisher.publish(
-                generated_briefs=[],
-                existing_rows=[
-                    {
-                        "slug": "legacy",
-                        "vertical": "ai_tech",
-                        "title": "Legacy",
-                        "published_at": "2026-02-20T00:00:00+09:00",
-                        "word_count": 900,
-                        "source_urls": ["https://example.com/a"],
-                        "ad_slots": ["top-banner"],
-                        "dedupe_hash": "legacy",
-                        "path": "/category/ai/legacy.html",
-                        "category": "ai",
-                        "meta_description": "Legacy description",
-                    }
-                ],
-                now_iso="2026-02-20T10:00:00+09:00",
-            )
+        site_dir = self._site_dir()
+        publisher = self._make_publisher(site_dir)
+        publisher.publish(
+            generated_briefs=[],
+            existing_rows=[_LEGACY_ROW],
+            now_iso="2026-02-20T10:00:00+09:00",
+        )
 
-            story = site_dir / "stories" / "ai" / "legacy.html"
-            redirect = site_dir / "category" / "ai" / "legacy.html"
-            self.assertTrue(story.exists())
-            self.assertTrue(redirect.exists())
-            self.assertIn("refresh", redirect.read_text(encoding="utf-8"))
+        files = self._html_files(site_dir)
+        self.assertIn("stories/ai/legacy.html", files)
+        self.assertIn("category/ai/legacy.html", files)
+        self.assertIn(b"refresh", (site_dir / "category" / "ai" / "legacy.html").read_bytes())
 
 
 if __name__ == "__main__":